@@ -18,6 +18,12 @@ class AgentKey(StrEnum):
     TEMPORAL_ANALYST = "temporal-analyst"
 
 
+# Shared, immutable tool sets; each agent gets its own list copy since
+# AgentDefinition.tools is typed list[str]
+READ_TOOLS: tuple[str, ...] = ("Read", "Grep")
+SEARCH_TOOLS: tuple[str, ...] = READ_TOOLS + ("Glob",)
+
+
 AGENTS: dict[AgentKey, AgentDefinition] = {
     AgentKey.TOPIC_EXTRACTOR: AgentDefinition(
         description="Extract and cluster topics from conversation content.",
@@ -30,7 +36,7 @@ Your task:
 4. Assign confidence scores based on evidence strength
 
 Be thorough but avoid over-extraction. Focus on meaningful, recurring themes.""",
-        tools=["Read", "Grep", "Glob"],
+        tools=list(SEARCH_TOOLS),
         model="sonnet",
     ),
     AgentKey.SENTIMENT_TRACKER: AgentDefinition(
@@ -44,7 +50,7 @@ Your task:
 4. Track satisfaction patterns
 
 Focus on patterns, not individual message sentiment.""",
-        tools=["Read", "Grep"],
+        tools=list(READ_TOOLS),
         model="sonnet",
     ),
     AgentKey.PATTERN_DETECTOR: AgentDefinition(
@@ -58,7 +64,7 @@ Your task:
 4. Highlight areas where improvements may be possible
 
 Be observational. Focus on pattern discovery, not prescriptive advice.""",
-        tools=["Read", "Grep", "Glob"],
+        tools=list(SEARCH_TOOLS),
         model="sonnet",
     ),
     AgentKey.TEMPORAL_ANALYST: AgentDefinition(
@@ -72,7 +78,7 @@ Your task:
 4. Detect trends and seasonality
 
 Use conversation timestamps to identify patterns. Be specific about dates.""",
-        tools=["Read", "Grep"],
+        tools=list(READ_TOOLS),
         model="haiku",
     ),
 }
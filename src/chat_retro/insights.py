@@ -8,6 +8,8 @@ from enum import StrEnum
 
 from claude_agent_sdk import AgentDefinition
 
+from chat_retro.agents import SEARCH_TOOLS
+
 
 class InsightKey(StrEnum):
     """Available insight agent identifiers."""
@@ -36,7 +38,7 @@ Focus on:
 - Output format requests
 
 Be specific. Use real examples from the conversations. Don't be generic.""",
-        tools=["Read", "Grep", "Glob"],
+        tools=list(SEARCH_TOOLS),
         model="sonnet",
     ),
     InsightKey.REPETITION_DETECTOR: AgentDefinition(
@@ -56,7 +58,7 @@ Look for:
 - Repeated context-setting
 
 Templates should be practical and immediately usable.""",
-        tools=["Read", "Grep", "Glob"],
+        tools=list(SEARCH_TOOLS),
         model="sonnet",
     ),
     InsightKey.USAGE_OPTIMIZER: AgentDefinition(
@@ -75,7 +77,7 @@ Consider:
 - Session length and depth patterns
 
 Be specific to this user's actual usage data. Avoid generic advice.""",
-        tools=["Read", "Grep", "Glob"],
+        tools=list(SEARCH_TOOLS),
         model="sonnet",
     ),
 }
@@ -239,7 +239,7 @@ class SessionManager:
         logs_dir.mkdir(parents=True, exist_ok=True)
         metrics_file = logs_dir / "metrics.jsonl"
         with metrics_file.open("a") as f:
-            f.write(json.dumps(self.session.usage.detailed_summary()) + "\n")
+            f.write(self.session.usage.detailed_summary_json() + "\n")
 
     async def interrupt(self) -> None:
         """Interrupt current agent execution and request exit."""
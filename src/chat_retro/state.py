@@ -3,6 +3,7 @@
 
 import hashlib
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -65,7 +66,13 @@ class AnalysisState(BaseModel):
     snapshots: list[SnapshotRef] = Field(default_factory=list)
 
 
-@dataclass
+# Call pydantic-core directly; model_dump_json/model_validate forward
+# ~15 kwargs per call through a Python wrapper.
+_ANALYSIS_SER = AnalysisState.__pydantic_serializer__
+_ANALYSIS_VALIDATOR = AnalysisState.__pydantic_validator__
+
+
+@dataclass(slots=True)
 class StateManager:
     """Read/write local analysis.json with migration support."""
 
@@ -81,36 +88,51 @@ class StateManager:
         if not self.state_path.exists():
             return None
 
+        raw = self.state_path.read_bytes()
+
+        # Fast path: current-version state parses and validates in one
+        # pydantic-core pass, without an intermediate Python dict.
+        try:
+            state = _ANALYSIS_VALIDATOR.validate_json(raw)
+            if (
+                "schema_version" in state.model_fields_set
+                and state.schema_version >= self.CURRENT_VERSION
+            ):
+                return state
+        except ValidationError:
+            pass  # Old schema or corrupt; handled below
+
         try:
-            data = json.loads(self.state_path.read_text())
+            data = json.loads(raw)
             version = data.get("schema_version", 0)
             if version < self.CURRENT_VERSION:
                 data = self._migrate(data, version)
-            return AnalysisState.model_validate(data)
+            return _ANALYSIS_VALIDATOR.validate_python(data)
         except json.JSONDecodeError as e:
-            self._report_corruption("Invalid JSON", str(e))
+            self._report_corruption("Invalid JSON", str(e), raw)
             backup = self.state_path.with_suffix(".json.corrupt")
             self.state_path.rename(backup)
             return None
         except ValidationError as e:
-            self._report_corruption("Schema validation failed", str(e))
+            self._report_corruption("Schema validation failed", str(e), raw)
             backup = self.state_path.with_suffix(".json.corrupt")
             self.state_path.rename(backup)
             return None
 
-    def _report_corruption(self, error_type: str, error_detail: str) -> None:
-        """Auto-create issue when state.json fails validation."""
+    def _report_corruption(
+        self, error_type: str, error_detail: str, raw: bytes = b""
+    ) -> None:
+        """Auto-create issue when state.json fails validation.
+
+        raw is the already-read file content; only a preview is included.
+        """
         if not self.report_corruption:
             return
 
         from shared import IssueReporter, IssueSeverity
 
-        # Capture preview of corrupt content for debugging
-        state_preview = ""
-        try:
-            state_preview = self.state_path.read_text()[:500]
-        except Exception:
-            pass
+        # Preview of corrupt content for debugging
+        state_preview = raw[:500].decode(errors="replace")
 
         reporter = IssueReporter()
         reporter.save_draft_issue(
@@ -129,13 +151,38 @@ class StateManager:
         )
 
     def save(self, state: AnalysisState) -> None:
-        """Persist state atomically."""
+        """Persist state atomically.
+
+        Writes to an exclusively-created tmp file, fsyncs it, verifies the
+        on-disk bytes by SHA-256, then swaps it in and fsyncs the directory.
+        """
         # Update last_updated timestamp
         state.meta.last_updated = datetime.now()
 
+        payload = _ANALYSIS_SER.to_json(state, indent=2)
         tmp = self.state_path.with_suffix(".json.tmp")
-        tmp.write_text(state.model_dump_json(indent=2))
-        tmp.rename(self.state_path)
+        tmp.unlink(missing_ok=True)  # Left behind by an interrupted save
+
+        fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        expected = hashlib.sha256(payload).digest()
+        if hashlib.sha256(tmp.read_bytes()).digest() != expected:
+            tmp.unlink(missing_ok=True)
+            raise OSError(f"Read-back verification failed for {tmp}")
+
+        os.replace(tmp, self.state_path)
+
+        # Persist the rename itself (directories can't be opened on Windows)
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(self.state_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
     def merge_patterns(
         self,
@@ -143,18 +190,17 @@ class StateManager:
         new: list[Pattern],
     ) -> list[Pattern]:
         """Merge patterns from incremental analysis."""
-        existing_ids = {p.id for p in existing}
+        index = {p.id: i for i, p in enumerate(existing)}
         merged = list(existing)
 
         for pattern in new:
-            if pattern.id not in existing_ids:
+            i = index.get(pattern.id)
+            if i is None:
+                index[pattern.id] = len(merged)
                 merged.append(pattern)
             else:
                 # Update existing pattern
-                for i, p in enumerate(merged):
-                    if p.id == pattern.id:
-                        merged[i] = pattern
-                        break
+                merged[i] = pattern
 
         return merged
 
@@ -2,11 +2,18 @@
 
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 
 PROMPTS_DIR = Path(__file__).parent / "template_prompts"
 
 
+@lru_cache(maxsize=None)
+def _load_prompt(prompt_file: str) -> str:
+    """Read a bundled prompt file once; prompt files are immutable."""
+    return (PROMPTS_DIR / prompt_file).read_text()
+
+
 class TemplateKey(StrEnum):
     """Available template identifiers."""
 
@@ -14,7 +21,7 @@ class TemplateKey(StrEnum):
     SELF_PORTRAIT_V2 = "self-portrait-v2"
 
 
-@dataclass
+@dataclass(slots=True)
 class Template:
     """A predefined analysis template."""
 
@@ -25,8 +32,8 @@ class Template:
 
     @property
     def prompt(self) -> str:
-        """Load prompt from file."""
-        return (PROMPTS_DIR / self.prompt_file).read_text()
+        """Load prompt from file (cached per filename)."""
+        return _load_prompt(self.prompt_file)
 
 
 TEMPLATES: dict[TemplateKey, Template] = {
@@ -4,32 +4,64 @@
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Annotated, TypedDict
+
+from pydantic import Field, TypeAdapter
 
 if TYPE_CHECKING:
     from claude_code_sdk import ResultMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorRecord:
     """Record of an error during session."""
 
     timestamp: str
-    error_type: str
+    error_type: Annotated[str, Field(serialization_alias="type")]
     message: str
     turn: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TurnTiming:
     """Timing data for a single turn."""
 
-    turn_number: int
+    turn_number: Annotated[int, Field(serialization_alias="turn")]
     latency_seconds: float
     timestamp: str
 
 
-@dataclass
+class _TokenSummary(TypedDict):
+    input: int
+    output: int
+    cache_read: int
+    total: int
+
+
+class _TimingSummary(TypedDict):
+    total_latency_seconds: float
+    avg_latency_seconds: float
+    session_duration_seconds: float
+    per_turn: list[TurnTiming]
+
+
+class _DetailedSummary(TypedDict):
+    """Shape of UsageReport.detailed_summary(), with records left as dataclasses."""
+
+    session_id: str
+    cost_usd: float
+    tokens: _TokenSummary
+    turns: int
+    timing: _TimingSummary
+    errors: list[ErrorRecord]
+
+
+# Serializes TurnTiming/ErrorRecord straight from their fields, using the
+# aliases above for the keys detailed_summary() renames
+_SUMMARY_SER = TypeAdapter(_DetailedSummary)
+
+
+@dataclass(slots=True)
 class UsageReport:
     """Track costs, tokens, latency, and errors across session."""
 
@@ -39,17 +71,30 @@ class UsageReport:
     output_tokens: int = 0
     cache_read_tokens: int = 0
     turns: int = 0
-    turn_timings: list[TurnTiming] = field(default_factory=list)
     errors: list[ErrorRecord] = field(default_factory=list)
     session_start: float = field(default_factory=time.time)
-    _processed_ids: set[str] = field(default_factory=set, repr=False)
     _turn_start: float | None = field(default=None, repr=False)
+    # Appended only by end_turn(), which keeps _total_latency in step
+    _turn_timings: list[TurnTiming] = field(default_factory=list, repr=False)
+    _total_latency: float = field(default=0.0, repr=False)
+
+    @property
+    def turn_timings(self) -> tuple[TurnTiming, ...]:
+        """Recorded turn timings, oldest first (read-only snapshot)."""
+        return tuple(self._turn_timings)
+
+    @turn_timings.setter
+    def turn_timings(self, timings: list[TurnTiming]) -> None:
+        """Replace all turn timings, re-summing the running total."""
+        self._turn_timings = list(timings)
+        self._total_latency = sum(t.latency_seconds for t in self._turn_timings)
 
     def update_from_result(self, msg: "ResultMessage") -> None:
         """Update from ResultMessage (contains cumulative totals).
 
-        Note: Multiple messages with same session_id report identical usage,
-        so we track processed IDs to avoid double-counting in edge cases.
+        Note: Multiple messages with same session_id report identical usage.
+        Values are overwritten rather than summed, so repeats never
+        double-count.
         """
         # ResultMessage contains cumulative values, so just overwrite
         self.session_id = msg.session_id
@@ -63,18 +108,23 @@ class UsageReport:
 
     def start_turn(self) -> None:
         """Mark the start of a turn for timing."""
-        self._turn_start = time.time()
+        self._turn_start = time.perf_counter()
 
     def end_turn(self) -> None:
         """Record turn completion and latency."""
         if self._turn_start is not None:
-            latency = time.time() - self._turn_start
+            # Monotonic clock for the interval, wall clock for the timestamp;
+            # both read once, together, so they mark the same turn end
+            end = time.perf_counter()
+            now = time.time()
+            latency = end - self._turn_start
             timing = TurnTiming(
-                turn_number=len(self.turn_timings) + 1,
+                turn_number=len(self._turn_timings) + 1,
                 latency_seconds=latency,
-                timestamp=datetime.now().isoformat(),
+                timestamp=datetime.fromtimestamp(now).isoformat(),
             )
-            self.turn_timings.append(timing)
+            self._turn_timings.append(timing)
+            self._total_latency += latency
             self._turn_start = None
 
     def record_error(self, error: Exception) -> None:
@@ -89,15 +139,19 @@ class UsageReport:
 
     @property
     def total_latency_seconds(self) -> float:
-        """Total time spent waiting for agent responses."""
-        return sum(t.latency_seconds for t in self.turn_timings)
+        """Total time spent waiting for agent responses.
+
+        Kept as a running total by end_turn() and the turn_timings setter,
+        the only ways timings change.
+        """
+        return self._total_latency
 
     @property
     def avg_latency_seconds(self) -> float:
         """Average latency per turn."""
-        if not self.turn_timings:
+        if not self._turn_timings:
             return 0.0
-        return self.total_latency_seconds / len(self.turn_timings)
+        return self._total_latency / len(self._turn_timings)
 
     @property
     def session_duration_seconds(self) -> float:
@@ -113,7 +167,7 @@ class UsageReport:
             f"{total_tokens:,} tokens",
             f"{self.turns} turns",
         ]
-        if self.turn_timings:
+        if self._turn_timings:
             parts.append(f"{self.avg_latency_seconds:.1f}s avg latency")
         if self.errors:
             parts.append(f"{len(self.errors)} errors")
@@ -141,7 +195,7 @@ class UsageReport:
                         "latency_seconds": t.latency_seconds,
                         "timestamp": t.timestamp,
                     }
-                    for t in self.turn_timings
+                    for t in self._turn_timings
                 ],
             },
             "errors": [
@@ -154,3 +208,29 @@ class UsageReport:
                 for e in self.errors
             ],
         }
+
+    def detailed_summary_json(self) -> str:
+        """Return detailed_summary() as a single compact JSON line.
+
+        Turn timings and errors are encoded from the dataclasses directly,
+        without building a dict per record first.
+        """
+        summary: _DetailedSummary = {
+            "session_id": self.session_id,
+            "cost_usd": self.total_cost_usd,
+            "tokens": {
+                "input": self.input_tokens,
+                "output": self.output_tokens,
+                "cache_read": self.cache_read_tokens,
+                "total": self.input_tokens + self.output_tokens,
+            },
+            "turns": self.turns,
+            "timing": {
+                "total_latency_seconds": self.total_latency_seconds,
+                "avg_latency_seconds": self.avg_latency_seconds,
+                "session_duration_seconds": self.session_duration_seconds,
+                "per_turn": self._turn_timings,
+            },
+            "errors": self.errors,
+        }
+        return _SUMMARY_SER.dump_json(summary, by_alias=True).decode()
@@ -4,12 +4,14 @@ Each template provides D3.js code for a specific visualization type.
 Templates expect data in a specific format and render into #visualization.
 """
 
+from chat_retro.viz_templates.columns import ConversationColumns
 from chat_retro.viz_templates.timeline import TimelineViz
 from chat_retro.viz_templates.heatmap import HeatmapViz
 from chat_retro.viz_templates.topic_clusters import TopicClusterViz
 from chat_retro.viz_templates.length_distribution import LengthDistributionViz
 
 __all__ = [
+    "ConversationColumns",
     "TimelineViz",
     "HeatmapViz",
     "TopicClusterViz",
@@ -0,0 +1,68 @@
+"""Per-conversation columns extracted once and shared across visualizations."""
+
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from chat_retro.viz_templates.timestamps import iter_datetimes
+
+
+def message_count(conv: dict[str, Any]) -> int:
+    """Number of messages in a conversation, never less than 1.
+
+    Empty conversations count as 1 so they fall in the first bin
+    rather than producing a bin starting below 1.
+    """
+    mapping = conv.get("mapping")
+    if isinstance(mapping, dict):
+        # ChatGPT format: mapping is dict of message nodes
+        return len(mapping) or 1
+    messages = conv.get("messages")
+    if isinstance(messages, list):
+        # Alternative format with messages list
+        return len(messages) or 1
+    # Fallback: no recognizable message structure
+    return 1
+
+
+@dataclass(slots=True)
+class ConversationColumns:
+    """Conversation fields pulled out of the raw export once.
+
+    Build this when rendering several visualizations from the same
+    export; each viz's prepare_data accepts it in place of the raw list
+    and skips re-walking the conversation dicts and re-parsing timestamps.
+    """
+
+    created: list[datetime] = field(default_factory=list)
+    lengths: list[int] = field(default_factory=list)
+
+    @classmethod
+    def from_conversations(
+        cls, conversations: Sequence[dict[str, Any]]
+    ) -> "ConversationColumns":
+        """Extract columns from raw conversation dicts."""
+        return cls(
+            created=list(iter_datetimes(conversations)),
+            lengths=list(map(message_count, conversations)),
+        )
+
+
+def created_datetimes(
+    conversations: list[dict[str, Any]] | ConversationColumns,
+) -> Iterable[datetime]:
+    """Creation datetimes from either raw conversations or prebuilt columns."""
+    if isinstance(conversations, ConversationColumns):
+        return conversations.created
+    return iter_datetimes(conversations)
+
+
+def message_counts(
+    conversations: list[dict[str, Any]] | ConversationColumns,
+) -> list[int]:
+    """Per-conversation message counts from raw conversations or prebuilt columns."""
+    if isinstance(conversations, ConversationColumns):
+        return conversations.lengths
+    return list(map(message_count, conversations))
@@ -1,78 +1,17 @@
 """Heatmap visualization: usage by hour and weekday."""
 
 
-from datetime import datetime
 from typing import Any
 
+from chat_retro.viz_templates.columns import ConversationColumns, created_datetimes
+from chat_retro.viz_templates.minify import minify_js
 
-class HeatmapViz:
-    """D3.js heatmap showing usage patterns by hour and weekday.
-
-    Expected data format:
-    {
-        "heatmap": [
-            {"day": 0, "hour": 9, "count": 5},  # Sunday 9am
-            ...
-        ]
-    }
-
-    Day: 0=Sunday, 6=Saturday
-    Hour: 0-23
-    """
-
-    @staticmethod
-    def prepare_data(conversations: list[dict[str, Any]]) -> dict[str, Any]:
-        """Convert raw conversations to heatmap data.
-
-        Args:
-            conversations: List of conversation dicts with 'create_time' or 'created_at'
 
-        Returns:
-            Data dict with 'heatmap' key containing day/hour/count entries
-        """
-        # Initialize 7x24 grid
-        counts: dict[tuple[int, int], int] = {}
-
-        for conv in conversations:
-            timestamp = conv.get("create_time") or conv.get("created_at")
-            if timestamp is None:
-                continue
-
-            # Convert timestamp to datetime
-            if isinstance(timestamp, (int, float)):
-                dt = datetime.fromtimestamp(timestamp)
-            elif isinstance(timestamp, str):
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                except ValueError:
-                    continue
-            else:
-                continue
-
-            # Get weekday (0=Monday in Python, we want 0=Sunday)
-            weekday = (dt.weekday() + 1) % 7
-            hour = dt.hour
-
-            key = (weekday, hour)
-            counts[key] = counts.get(key, 0) + 1
-
-        # Convert to list format
-        heatmap = [
-            {"day": day, "hour": hour, "count": count}
-            for (day, hour), count in sorted(counts.items())
-        ]
-
-        return {"heatmap": heatmap}
-
-    @staticmethod
-    def get_js_code() -> str:
-        """Return D3.js code for heatmap visualization.
-
-        The code expects DATA.heatmap to be an array of {day, hour, count} objects.
-        """
-        return """
+_JS_CODE = minify_js("""
 (function() {
-    const data = DATA.heatmap || [];
+    // Typed grid indexed by day * 24 + hour; missing entries stay 0
+    const counts = new Int32Array(168);
+    counts.set((DATA.heatmap || []).slice(0, 168));
     const container = document.getElementById('visualization');
     const days = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
 
@@ -82,11 +21,14 @@ class HeatmapViz:
     const width = 24 * cellSize;
     const height = 7 * cellSize;
 
-    // Build lookup
-    const countMap = new Map();
-    data.forEach(d => countMap.set(`${d.day}-${d.hour}`, d.count));
-    const maxCount = d3.max(data, d => d.count) || 1;
-    const totalCount = d3.sum(data, d => d.count);
+    // Max and total in one scan over the grid
+    let maxCount = 0, totalCount = 0;
+    for (let i = 0; i < 168; i++) {
+        const c = counts[i];
+        totalCount += c;
+        if (c > maxCount) maxCount = c;
+    }
+    maxCount = maxCount || 1;
 
     container.innerHTML = '';
     const svg = d3.select('#visualization')
@@ -104,18 +46,18 @@ class HeatmapViz:
     const x = d3.scaleBand().domain(d3.range(24)).range([0, width]).padding(0.08);
     const y = d3.scaleBand().domain(d3.range(7)).range([0, height]).padding(0.08);
 
-    // Draw cells
+    // Draw cells in a single data join
+    const cells = [];
     for (let day = 0; day < 7; day++) {
         for (let hour = 0; hour < 24; hour++) {
-            const count = countMap.get(`${day}-${hour}`) || 0;
-            svg.append('rect')
-                .attr('x', x(hour)).attr('y', y(day)).attr('width', x.bandwidth()).attr('height', y.bandwidth())
-                .attr('fill', count > 0 ? colorScale(count) : '#f9fafb')
-                .attr('stroke', '#fff').attr('stroke-width', 2).attr('rx', 4)
-                .attr('data-day', day).attr('data-hour', hour).attr('data-count', count)
-                .style('cursor', 'pointer').style('transition', 'opacity 0.1s');
+            cells.push({day, hour, count: counts[day * 24 + hour]});
         }
     }
+    svg.selectAll('rect.cell').data(cells).join('rect').attr('class', 'cell')
+        .attr('x', d => x(d.hour)).attr('y', d => y(d.day)).attr('width', x.bandwidth()).attr('height', y.bandwidth())
+        .attr('fill', d => d.count > 0 ? colorScale(d.count) : '#f9fafb')
+        .attr('stroke', '#fff').attr('stroke-width', 2).attr('rx', 4)
+        .style('cursor', 'pointer').style('transition', 'opacity 0.1s');
 
     // X axis (hours)
     svg.append('g').attr('transform', `translate(0,${height + 8})`)
@@ -143,25 +85,75 @@ class HeatmapViz:
     svg.append('text').attr('x', legendX - 5).attr('y', -49).attr('text-anchor', 'end').attr('fill', '#9ca3af').style('font-size', '10px').text('0');
     svg.append('text').attr('x', legendX + legendW + 5).attr('y', -49).attr('text-anchor', 'start').attr('fill', '#9ca3af').style('font-size', '10px').text(maxCount);
 
-    // Tooltip
-    const tooltip = d3.select('#visualization').append('div')
-        .style('position', 'absolute').style('background', '#1f2937').style('color', '#fff').style('padding', '12px 16px')
-        .style('border-radius', '8px').style('font-size', '13px').style('font-family', 'system-ui').style('box-shadow', '0 10px 25px -5px rgba(0,0,0,0.2)')
-        .style('pointer-events', 'none').style('opacity', 0).style('transition', 'opacity 0.15s');
-
-    svg.selectAll('rect')
-        .on('mouseover', function(event) {
-            const day = +this.getAttribute('data-day');
-            const hour = +this.getAttribute('data-hour');
-            const count = +this.getAttribute('data-count');
-            const hourStr = hour === 0 ? '12am' : hour < 12 ? hour + 'am' : hour === 12 ? '12pm' : (hour - 12) + 'pm';
-            d3.select(this).style('opacity', 0.8);
-            tooltip.style('opacity', 1).html(`<div style="font-weight:600;margin-bottom:4px">${days[day]} at ${hourStr}</div><div style="color:#c4b5fd">${count} conversation${count !== 1 ? 's' : ''}</div>`)
-                .style('left', (event.pageX + 15) + 'px').style('top', (event.pageY - 50) + 'px');
-        })
-        .on('mouseout', function() {
-            d3.select(this).style('opacity', 1);
-            tooltip.style('opacity', 0);
-        });
+    // Tooltip (shared across visualizations on the page)
+    let tooltip = d3.select('#viz-tooltip');
+    if (tooltip.empty()) {
+        tooltip = d3.select('body').append('div').attr('id', 'viz-tooltip')
+            .style('position', 'absolute').style('background', '#1f2937').style('color', '#fff').style('padding', '12px 16px')
+            .style('border-radius', '8px').style('font-size', '13px').style('font-family', 'system-ui').style('box-shadow', '0 10px 25px -5px rgba(0,0,0,0.2)')
+            .style('pointer-events', 'none').style('opacity', 0).style('transition', 'opacity 0.15s');
+    }
+
+    // Delegate cell hover to the chart group (one listener per event type)
+    svg.on('mouseover', function(event) {
+        const cell = event.target;
+        if (!cell.classList.contains('cell')) return;
+        // Read the bound cell object; no DOM attribute round-trip
+        const {day, hour, count} = d3.select(cell).datum();
+        const hourStr = hour === 0 ? '12am' : hour < 12 ? hour + 'am' : hour === 12 ? '12pm' : (hour - 12) + 'pm';
+        d3.select(cell).style('opacity', 0.8);
+        tooltip.style('opacity', 1).html(`<div style="font-weight:600;margin-bottom:4px">${days[day]} at ${hourStr}</div><div style="color:#c4b5fd">${count} conversation${count !== 1 ? 's' : ''}</div>`)
+            .style('left', (event.pageX + 15) + 'px').style('top', (event.pageY - 50) + 'px');
+    }).on('mouseout', function(event) {
+        const cell = event.target;
+        if (!cell.classList.contains('cell')) return;
+        d3.select(cell).style('opacity', 1);
+        tooltip.style('opacity', 0);
+    });
 })();
-"""
+""")
+
+
+class HeatmapViz:
+    """D3.js heatmap showing usage patterns by hour and weekday.
+
+    Expected data format:
+    {
+        "heatmap": [0, 0, ..., 5, ...]  # 168 counts, index = day * 24 + hour
+    }
+
+    Day: 0=Sunday, 6=Saturday
+    Hour: 0-23
+    """
+
+    @staticmethod
+    def prepare_data(
+        conversations: list[dict[str, Any]] | ConversationColumns,
+    ) -> dict[str, Any]:
+        """Convert raw conversations to heatmap data.
+
+        Args:
+            conversations: List of conversation dicts with 'create_time' or 'created_at',
+                or ConversationColumns already extracted from them
+
+        Returns:
+            Data dict with 'heatmap' key containing a flat 7x24 list of counts
+        """
+        # Flat 7x24 grid indexed by day * 24 + hour
+        counts = [0] * (7 * 24)
+
+        for dt in created_datetimes(conversations):
+            # Get weekday (0=Monday in Python, we want 0=Sunday)
+            weekday = (dt.weekday() + 1) % 7
+            counts[weekday * 24 + dt.hour] += 1
+
+        return {"heatmap": counts}
+
+    @staticmethod
+    def get_js_code() -> str:
+        """Return D3.js code for heatmap visualization.
+
+        The code expects DATA.heatmap to be a flat array of 168 counts
+        indexed by day * 24 + hour.
+        """
+        return _JS_CODE
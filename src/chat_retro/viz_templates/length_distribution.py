@@ -1,108 +1,14 @@
 """Length distribution visualization: conversation length histogram."""
 
 
+from collections import Counter
 from typing import Any
 
+from chat_retro.viz_templates.columns import ConversationColumns, message_counts
+from chat_retro.viz_templates.minify import minify_js
 
-class LengthDistributionViz:
-    """D3.js histogram showing distribution of conversation lengths.
-
-    Expected data format:
-    {
-        "distribution": [
-            {"bin": "1-5", "min": 1, "max": 5, "count": 20},
-            {"bin": "6-10", "min": 6, "max": 10, "count": 35},
-            ...
-        ],
-        "stats": {
-            "total": 100,
-            "min": 1,
-            "max": 50,
-            "mean": 12.5,
-            "median": 10
-        }
-    }
-    """
-
-    @staticmethod
-    def prepare_data(
-        conversations: list[dict[str, Any]],
-        bin_size: int = 5,
-    ) -> dict[str, Any]:
-        """Convert conversations to length distribution data.
-
-        Args:
-            conversations: List of conversation dicts with 'mapping' (messages)
-            bin_size: Size of each histogram bin
-
-        Returns:
-            Data dict with 'distribution' and 'stats'
-        """
-        # Extract conversation lengths (number of messages)
-        lengths: list[int] = []
-
-        for conv in conversations:
-            # Try different structures for message count
-            if "mapping" in conv and isinstance(conv["mapping"], dict):
-                # ChatGPT format: mapping is dict of message nodes
-                length = len(conv["mapping"]) or 1
-            elif "messages" in conv and isinstance(conv["messages"], list):
-                # Alternative format with messages list
-                length = len(conv["messages"]) or 1
-            else:
-                # Fallback: count any list-like content
-                length = 1
-
-            lengths.append(length)
-
-        if not lengths:
-            return {"distribution": [], "stats": {}}
 
-        # Calculate statistics
-        sorted_lengths = sorted(lengths)
-        total = len(lengths)
-        min_len = min(lengths)
-        max_len = max(lengths)
-        mean = sum(lengths) / total
-        median = sorted_lengths[total // 2] if total % 2 == 1 else (
-            sorted_lengths[total // 2 - 1] + sorted_lengths[total // 2]
-        ) / 2
-
-        # Create bins
-        bins: dict[int, int] = {}  # bin_start -> count
-        for length in lengths:
-            bin_start = ((length - 1) // bin_size) * bin_size + 1
-            bins[bin_start] = bins.get(bin_start, 0) + 1
-
-        # Convert to list format
-        distribution = []
-        for bin_start in sorted(bins.keys()):
-            bin_end = bin_start + bin_size - 1
-            distribution.append({
-                "bin": f"{bin_start}-{bin_end}",
-                "min": bin_start,
-                "max": bin_end,
-                "count": bins[bin_start],
-            })
-
-        return {
-            "distribution": distribution,
-            "stats": {
-                "total": total,
-                "min": min_len,
-                "max": max_len,
-                "mean": round(mean, 1),
-                "median": median,
-            },
-        }
-
-    @staticmethod
-    def get_js_code() -> str:
-        """Return D3.js code for length distribution visualization.
-
-        The code expects DATA.distribution and DATA.stats.
-        """
-        return """
+_JS_CODE = minify_js("""
 (function() {
     const data = DATA.distribution || [];
     const stats = DATA.stats || {};
@@ -173,11 +79,14 @@ class LengthDistributionViz:
         card.append('text').attr('x', 118).attr('y', 22 + i * 18).attr('text-anchor', 'end').attr('fill', '#111827').style('font-size', '12px').style('font-weight', '600').text(item.v);
     });
 
-    // Tooltip
-    const tooltip = d3.select('#visualization').append('div')
-        .style('position', 'absolute').style('background', '#1f2937').style('color', '#fff').style('padding', '12px 16px')
-        .style('border-radius', '8px').style('font-size', '13px').style('font-family', 'system-ui').style('box-shadow', '0 10px 25px -5px rgba(0,0,0,0.2)')
-        .style('pointer-events', 'none').style('opacity', 0).style('transition', 'opacity 0.15s');
+    // Tooltip (shared across visualizations on the page)
+    let tooltip = d3.select('#viz-tooltip');
+    if (tooltip.empty()) {
+        tooltip = d3.select('body').append('div').attr('id', 'viz-tooltip')
+            .style('position', 'absolute').style('background', '#1f2937').style('color', '#fff').style('padding', '12px 16px')
+            .style('border-radius', '8px').style('font-size', '13px').style('font-family', 'system-ui').style('box-shadow', '0 10px 25px -5px rgba(0,0,0,0.2)')
+            .style('pointer-events', 'none').style('opacity', 0).style('transition', 'opacity 0.15s');
+    }
 
     svg.selectAll('.bar')
         .on('mouseover', function(event, d) {
@@ -190,4 +99,103 @@ class LengthDistributionViz:
             tooltip.style('opacity', 0);
         });
 })();
-"""
+""")
+
+
+def _median_from_counts(ordered: list[tuple[int, int]], total: int) -> float:
+    """Median of a multiset given as sorted (value, count) pairs."""
+    lo_idx, hi_idx = (total - 1) // 2, total // 2
+    lo = 0
+    seen = 0
+    for value, count in ordered:
+        if seen <= lo_idx < seen + count:
+            lo = value
+        seen += count
+        if seen > hi_idx:
+            return lo if lo_idx == hi_idx else (lo + value) / 2
+    return 0
+
+
+class LengthDistributionViz:
+    """D3.js histogram showing distribution of conversation lengths.
+
+    Expected data format:
+    {
+        "distribution": [
+            {"bin": "1-5", "min": 1, "max": 5, "count": 20},
+            {"bin": "6-10", "min": 6, "max": 10, "count": 35},
+            ...
+        ],
+        "stats": {
+            "total": 100,
+            "min": 1,
+            "max": 50,
+            "mean": 12.5,
+            "median": 10
+        }
+    }
+    """
+
+    @staticmethod
+    def prepare_data(
+        conversations: list[dict[str, Any]] | ConversationColumns,
+        bin_size: int = 5,
+    ) -> dict[str, Any]:
+        """Convert conversations to length distribution data.
+
+        Args:
+            conversations: List of conversation dicts with 'mapping' (messages),
+                or ConversationColumns already extracted from them
+            bin_size: Size of each histogram bin
+
+        Returns:
+            Data dict with 'distribution' and 'stats'
+        """
+        lengths = message_counts(conversations)
+        if not lengths:
+            return {"distribution": [], "stats": {}}
+
+        # Single pass over lengths: distinct length -> count
+        ordered = sorted(Counter(lengths).items())
+
+        # Calculate statistics from the (small) set of distinct lengths
+        total = len(lengths)
+        min_len = ordered[0][0]
+        max_len = ordered[-1][0]
+        mean = sum(length * count for length, count in ordered) / total
+        median = _median_from_counts(ordered, total)
+
+        # Create bins
+        bins: Counter[int] = Counter()  # bin_start -> count
+        for length, count in ordered:
+            bins[((length - 1) // bin_size) * bin_size + 1] += count
+
+        # Convert to list format
+        distribution = []
+        for bin_start in sorted(bins.keys()):
+            bin_end = bin_start + bin_size - 1
+            distribution.append({
+                "bin": f"{bin_start}-{bin_end}",
+                "min": bin_start,
+                "max": bin_end,
+                "count": bins[bin_start],
+            })
+
+        return {
+            "distribution": distribution,
+            "stats": {
+                "total": total,
+                "min": min_len,
+                "max": max_len,
+                "mean": round(mean, 1),
+                "median": median,
+            },
+        }
+
+    @staticmethod
+    def get_js_code() -> str:
+        """Return D3.js code for length distribution visualization.
+
+        The code expects DATA.distribution and DATA.stats.
+        """
+        return _JS_CODE
@@ -0,0 +1,12 @@
+"""Import-time minification for the embedded D3.js templates."""
+
+
+def minify_js(source: str) -> str:
+    """Drop indentation, blank lines and full-line // comments.
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly
+    as in the readable source. Templates must not use multi-line string
+    literals, whose indentation would be altered.
+    """
+    lines = (line.strip() for line in source.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
@@ -1,79 +1,17 @@
 """Timeline visualization: conversation frequency over time."""
 
 
+import calendar
+from collections import Counter
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date
 from typing import Any
 
+from chat_retro.viz_templates.columns import ConversationColumns, created_datetimes
+from chat_retro.viz_templates.minify import minify_js
 
-@dataclass
-class TimelineDataPoint:
-    """Single data point for timeline visualization."""
-
-    date: str  # ISO date string (YYYY-MM-DD)
-    count: int  # Number of conversations on this date
-
-
-class TimelineViz:
-    """D3.js timeline showing conversation frequency over time.
-
-    Expected data format:
-    {
-        "timeline": [
-            {"date": "2024-01-15", "count": 5},
-            {"date": "2024-01-16", "count": 3},
-            ...
-        ]
-    }
-    """
-
-    @staticmethod
-    def prepare_data(conversations: list[dict[str, Any]]) -> dict[str, Any]:
-        """Convert raw conversations to timeline data.
 
-        Args:
-            conversations: List of conversation dicts with 'create_time' or 'created_at'
-
-        Returns:
-            Data dict with 'timeline' key containing date/count pairs
-        """
-        date_counts: dict[str, int] = {}
-
-        for conv in conversations:
-            # Handle different export formats
-            timestamp = conv.get("create_time") or conv.get("created_at")
-            if timestamp is None:
-                continue
-
-            # Convert timestamp to date string
-            if isinstance(timestamp, (int, float)):
-                dt = datetime.fromtimestamp(timestamp)
-            elif isinstance(timestamp, str):
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                except ValueError:
-                    continue
-            else:
-                continue
-
-            date_str = dt.strftime("%Y-%m-%d")
-            date_counts[date_str] = date_counts.get(date_str, 0) + 1
-
-        # Sort by date
-        timeline = [
-            {"date": date, "count": count}
-            for date, count in sorted(date_counts.items())
-        ]
-
-        return {"timeline": timeline}
-
-    @staticmethod
-    def get_js_code() -> str:
-        """Return D3.js code for timeline visualization.
-
-        The code expects DATA.timeline to be an array of {date, count} objects.
-        """
-        return """
+_JS_CODE = minify_js("""
 (function() {
     const data = DATA.timeline || [];
     const container = document.getElementById('visualization');
@@ -83,13 +21,25 @@ class TimelineViz:
         return;
     }
 
-    // Parse dates
-    const parseDate = d3.timeParse("%Y-%m-%d");
-    const parsedData = data.map(d => ({date: parseDate(d.date), count: d.count})).filter(d => d.date !== null);
-    if (parsedData.length === 0) {
-        container.innerHTML = '<div style="text-align:center;padding:80px 20px;color:#6b7280;font-family:system-ui">Could not parse dates</div>';
-        return;
-    }
+    // Rows are [UTC-midnight ms, count] for active days only; no string
+    // parsing needed. Everything below stays in UTC (utcDay, scaleUtc,
+    // utcFormat) so the viewer's timezone and DST can't shift the days.
+    const activeData = data.map(([ms, count]) => ({date: new Date(ms), count}));
+
+    // Pin the line to zero on the days bordering each gap so the curve
+    // drops to the baseline instead of interpolating across missing days.
+    // Two points per gap, however long the gap is.
+    const parsedData = [];
+    activeData.forEach((d, i) => {
+        const prev = activeData[i - 1];
+        if (prev) {
+            const after = d3.utcDay.offset(prev.date, 1);
+            const before = d3.utcDay.offset(d.date, -1);
+            if (after < d.date) parsedData.push({date: after, count: 0});
+            if (before > after) parsedData.push({date: before, count: 0});
+        }
+        parsedData.push(d);
+    });
 
     // Dimensions
     const margin = {top: 60, right: 40, bottom: 60, left: 60};
@@ -112,7 +62,7 @@ class TimelineViz:
     grad.append('stop').attr('offset', '100%').attr('stop-color', '#8b5cf6').attr('stop-opacity', 0.05);
 
     // Scales
-    const x = d3.scaleTime().domain(d3.extent(parsedData, d => d.date)).range([0, width]);
+    const x = d3.scaleUtc().domain(d3.extent(parsedData, d => d.date)).range([0, width]);
     const y = d3.scaleLinear().domain([0, d3.max(parsedData, d => d.count) * 1.1]).nice().range([height, 0]);
 
     // Grid
@@ -127,7 +77,7 @@ class TimelineViz:
     svg.append('path').datum(parsedData).attr('fill', 'none').attr('stroke', '#8b5cf6').attr('stroke-width', 2.5).attr('stroke-linejoin', 'round').attr('d', line);
 
     // Axes
-    svg.append('g').attr('transform', `translate(0,${height})`).call(d3.axisBottom(x).ticks(6).tickFormat(d3.timeFormat('%b %d')).tickSize(0).tickPadding(10))
+    svg.append('g').attr('transform', `translate(0,${height})`).call(d3.axisBottom(x).ticks(6).tickFormat(d3.utcFormat('%b %d')).tickSize(0).tickPadding(10))
         .call(g => g.select('.domain').attr('stroke', '#e5e7eb'))
         .call(g => g.selectAll('text').attr('fill', '#6b7280').style('font-size', '11px'));
     svg.append('g').call(d3.axisLeft(y).ticks(5).tickSize(-width).tickPadding(10))
@@ -139,25 +89,28 @@ class TimelineViz:
     svg.append('text').attr('x', width / 2).attr('y', height + 45).attr('text-anchor', 'middle').attr('fill', '#9ca3af').style('font-size', '12px').text('Date');
     svg.append('text').attr('transform', 'rotate(-90)').attr('x', -height / 2).attr('y', -45).attr('text-anchor', 'middle').attr('fill', '#9ca3af').style('font-size', '12px').text('Conversations');
 
-    // Title + Summary
-    const total = d3.sum(parsedData, d => d.count);
-    const avg = (total / parsedData.length).toFixed(1);
+    // Title + Summary (average over active days, not the zero anchors)
+    const total = d3.sum(activeData, d => d.count);
+    const avg = (total / activeData.length).toFixed(1);
     svg.append('text').attr('x', 0).attr('y', -35).attr('fill', '#111827').style('font-size', '18px').style('font-weight', '600').text('Conversation Activity');
     svg.append('text').attr('x', 0).attr('y', -15).attr('fill', '#6b7280').style('font-size', '13px').text(`${total} total conversations · ${avg} avg per day`);
 
-    // Tooltip
-    const tooltip = d3.select('#visualization').append('div')
-        .style('position', 'absolute').style('background', '#1f2937').style('color', '#fff').style('padding', '12px 16px')
-        .style('border-radius', '8px').style('font-size', '13px').style('font-family', 'system-ui').style('box-shadow', '0 10px 25px -5px rgba(0,0,0,0.2)')
-        .style('pointer-events', 'none').style('opacity', 0).style('transition', 'opacity 0.15s');
+    // Tooltip (shared across visualizations on the page)
+    let tooltip = d3.select('#viz-tooltip');
+    if (tooltip.empty()) {
+        tooltip = d3.select('body').append('div').attr('id', 'viz-tooltip')
+            .style('position', 'absolute').style('background', '#1f2937').style('color', '#fff').style('padding', '12px 16px')
+            .style('border-radius', '8px').style('font-size', '13px').style('font-family', 'system-ui').style('box-shadow', '0 10px 25px -5px rgba(0,0,0,0.2)')
+            .style('pointer-events', 'none').style('opacity', 0).style('transition', 'opacity 0.15s');
+    }
 
-    // Dots
-    svg.selectAll('.dot').data(parsedData).enter().append('circle').attr('class', 'dot')
+    // Dots (only on active days; zero anchors just shape the line)
+    svg.selectAll('.dot').data(activeData).enter().append('circle').attr('class', 'dot')
         .attr('cx', d => x(d.date)).attr('cy', d => y(d.count)).attr('r', 5)
         .attr('fill', '#8b5cf6').attr('stroke', '#fff').attr('stroke-width', 2).style('cursor', 'pointer')
         .on('mouseover', function(event, d) {
             d3.select(this).transition().duration(100).attr('r', 8);
-            tooltip.style('opacity', 1).html(`<div style="font-weight:600;margin-bottom:4px">${d3.timeFormat('%B %d, %Y')(d.date)}</div><div style="color:#c4b5fd">${d.count} conversation${d.count !== 1 ? 's' : ''}</div>`)
+            tooltip.style('opacity', 1).html(`<div style="font-weight:600;margin-bottom:4px">${d3.utcFormat('%B %d, %Y')(d.date)}</div><div style="color:#c4b5fd">${d.count} conversation${d.count !== 1 ? 's' : ''}</div>`)
                 .style('left', (event.pageX + 15) + 'px').style('top', (event.pageY - 50) + 'px');
         })
         .on('mouseout', function() {
@@ -165,4 +118,69 @@ class TimelineViz:
             tooltip.style('opacity', 0);
         });
 })();
-"""
+""")
+
+
+@dataclass
+class TimelineDataPoint:
+    """Single data point for timeline visualization."""
+
+    timestamp_ms: int  # UTC midnight of the day, ms since epoch
+    count: int  # Number of conversations on this date
+
+
+def _midnight_ms(day: date) -> int:
+    """UTC midnight of a day as JS-style milliseconds since epoch.
+
+    UTC rather than local midnight, so the value names the same calendar
+    day whatever timezone the page is generated or viewed in.
+    """
+    return calendar.timegm(day.timetuple()) * 1000
+
+
+class TimelineViz:
+    """D3.js timeline showing conversation frequency over time.
+
+    Expected data format:
+    {
+        "timeline": [
+            [1705276800000, 5],  # [UTC midnight ms, count]
+            [1705449600000, 3],  # only days with conversations are listed
+            ...
+        ]
+    }
+    """
+
+    @staticmethod
+    def prepare_data(
+        conversations: list[dict[str, Any]] | ConversationColumns,
+    ) -> dict[str, Any]:
+        """Convert raw conversations to timeline data.
+
+        Args:
+            conversations: List of conversation dicts with 'create_time' or 'created_at',
+                or ConversationColumns already extracted from them
+
+        Returns:
+            Data dict with 'timeline' key containing sorted [ms, count]
+            pairs for days that have conversations
+        """
+        # Bucket by date object; timestamps are only built per day
+        day_counts = Counter(dt.date() for dt in created_datetimes(conversations))
+        # Active days only: the JS pins gaps to zero at their edges, so an
+        # outlier date (e.g. an epoch-0 create_time) costs two points in
+        # the browser rather than a row for every day in between
+        timeline = [
+            [_midnight_ms(day), count] for day, count in sorted(day_counts.items())
+        ]
+
+        return {"timeline": timeline}
+
+    @staticmethod
+    def get_js_code() -> str:
+        """Return D3.js code for timeline visualization.
+
+        The code expects DATA.timeline to be a sorted array of [ms, count]
+        pairs; gaps between days are drawn at zero.
+        """
+        return _JS_CODE
@@ -0,0 +1,34 @@
+"""Timestamp parsing shared by the time-based visualizations."""
+
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import Any
+
+# Bound once; these are called per conversation on large exports
+_fromtimestamp = datetime.fromtimestamp
+_fromisoformat = datetime.fromisoformat
+
+
+def iter_datetimes(conversations: Iterable[dict[str, Any]]) -> Iterator[datetime]:
+    """Yield creation datetimes, skipping missing or unparseable timestamps.
+
+    Accepts epoch numbers ('create_time', ChatGPT) or ISO-8601 strings
+    ('created_at', Claude). Epoch values are converted to local time.
+    """
+    for conv in conversations:
+        # Explicit None check so a falsy-but-valid epoch 0 is kept
+        timestamp = conv.get("create_time")
+        if timestamp is None:
+            timestamp = conv.get("created_at")
+            if timestamp is None:
+                continue
+
+        if isinstance(timestamp, (int, float)):
+            yield _fromtimestamp(timestamp)
+        elif isinstance(timestamp, str):
+            try:
+                # Python 3.11+ parses the "Z" suffix natively
+                yield _fromisoformat(timestamp)
+            except ValueError:
+                continue
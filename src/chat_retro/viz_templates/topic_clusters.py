@@ -1,99 +1,21 @@
 """Topic clusters visualization: force-directed topic graph."""
 
 
-from collections import defaultdict
+import heapq
+from collections import Counter, defaultdict
+from itertools import combinations
 from typing import Any
 
+from chat_retro.viz_templates.minify import minify_js
 
-class TopicClusterViz:
-    """D3.js force-directed graph showing topic clusters.
-
-    Expected data format:
-    {
-        "nodes": [{"id": "python", "group": 1, "count": 50}, ...],
-        "links": [{"source": "python", "target": "debugging", "value": 10}, ...]
-    }
-    """
-
-    @staticmethod
-    def prepare_data(patterns: list[dict[str, Any]]) -> dict[str, Any]:
-        """Convert patterns to topic cluster data.
-
-        Args:
-            patterns: List of pattern dicts with 'label', 'type', and 'conversation_ids'
-
-        Returns:
-            Data dict with 'nodes' and 'links' for force-directed graph
-        """
-        if not patterns:
-            return {"nodes": [], "links": []}
-
-        # Group patterns by type for coloring
-        type_to_group: dict[str, int] = {}
-        group_counter = 0
-
-        nodes = []
-        for pattern in patterns:
-            label = pattern.get("label", "")
-            if not label:
-                continue
-
-            pattern_type = pattern.get("type", "unknown")
-            if pattern_type not in type_to_group:
-                type_to_group[pattern_type] = group_counter
-                group_counter += 1
 
-            # Count is based on number of conversations
-            conv_ids = pattern.get("conversation_ids", [])
-            count = len(conv_ids) if isinstance(conv_ids, list) else 1
-
-            nodes.append({
-                "id": label,
-                "group": type_to_group[pattern_type],
-                "count": count,
-                "type": pattern_type,
-            })
-
-        # Build links based on shared conversations
-        # Patterns that appear in the same conversations are linked
-        conv_to_patterns: dict[str, list[str]] = defaultdict(list)
-        for pattern in patterns:
-            label = pattern.get("label", "")
-            if not label:
-                continue
-            for conv_id in pattern.get("conversation_ids", []):
-                conv_to_patterns[conv_id].append(label)
-
-        # Count co-occurrences
-        link_counts: dict[tuple[str, str], int] = defaultdict(int)
-        for labels in conv_to_patterns.values():
-            if len(labels) < 2:
-                continue
-            # All pairs of patterns in this conversation
-            for i, label1 in enumerate(labels):
-                for label2 in labels[i + 1:]:
-                    key = tuple(sorted([label1, label2]))
-                    link_counts[key] += 1
-
-        # Convert to links (only include significant links)
-        links = [
-            {"source": src, "target": tgt, "value": count}
-            for (src, tgt), count in link_counts.items()
-            if count >= 1  # Minimum co-occurrence threshold
-        ]
-
-        return {"nodes": nodes, "links": links}
-
-    @staticmethod
-    def get_js_code() -> str:
-        """Return D3.js code for topic cluster visualization.
-
-        The code expects DATA.nodes and DATA.links arrays.
-        """
-        return """
+_JS_CODE = minify_js("""
 (function() {
-    const nodes = DATA.nodes || [];
-    const links = DATA.links || [];
+    // Decode compact rows into the objects d3-force mutates
+    const groupTypes = DATA.types || [];
+    const nodes = (DATA.nodes || []).map(([id, group, count]) => ({id, group, count, type: groupTypes[group]}));
+    const links = (DATA.links || []).map(([source, target, value]) => ({source, target, value}));
+    const CANVAS_NODE_THRESHOLD = 500;
     const container = document.getElementById('visualization');
 
     if (nodes.length === 0) {
@@ -104,13 +26,6 @@ class TopicClusterViz:
     const width = Math.min(container.clientWidth || 800, 960);
     const height = 520;
 
-    container.innerHTML = '';
-    const svg = d3.select('#visualization')
-        .append('svg')
-        .attr('width', width)
-        .attr('height', height)
-        .style('font-family', 'system-ui, -apple-system, sans-serif');
-
     // Modern color palette
     const colors = ['#8b5cf6', '#06b6d4', '#10b981', '#f59e0b', '#ef4444', '#ec4899', '#6366f1', '#14b8a6'];
     const color = d3.scaleOrdinal(colors);
@@ -118,13 +33,112 @@ class TopicClusterViz:
     const maxCount = d3.max(nodes, d => d.count) || 1;
     const radiusScale = d3.scaleSqrt().domain([1, maxCount]).range([12, 40]);
 
+    // Tooltip (shared across visualizations on the page)
+    let tooltip = d3.select('#viz-tooltip');
+    if (tooltip.empty()) {
+        tooltip = d3.select('body').append('div').attr('id', 'viz-tooltip')
+            .style('position', 'absolute').style('background', '#1f2937').style('color', '#fff').style('padding', '12px 16px')
+            .style('border-radius', '8px').style('font-size', '13px').style('font-family', 'system-ui').style('box-shadow', '0 10px 25px -5px rgba(0,0,0,0.2)')
+            .style('pointer-events', 'none').style('opacity', 0).style('transition', 'opacity 0.15s');
+    }
+
+    const tooltipHtml = d => `<div style="font-weight:600;margin-bottom:6px">${d.id}</div><div style="color:#9ca3af;font-size:11px;text-transform:uppercase;letter-spacing:0.5px;margin-bottom:4px">${d.type}</div><div style="color:#c4b5fd">${d.count} conversation${d.count !== 1 ? 's' : ''}</div>`;
+
+    // The tooltip is shared, so the width cap is applied per show and
+    // removed on hide rather than left on the element for other vizs
+    const showTooltip = (event, d) => tooltip.style('opacity', 1).style('max-width', '200px')
+        .html(tooltipHtml(d))
+        .style('left', (event.pageX + 15) + 'px').style('top', (event.pageY - 60) + 'px');
+    const hideTooltip = () => tooltip.style('opacity', 0).style('max-width', null);
+
     // Simulation
     const simulation = d3.forceSimulation(nodes)
-        .force('link', d3.forceLink(links).id(d => d.id).distance(120))
+        .force('link', d3.forceLink(links).distance(120))
         .force('charge', d3.forceManyBody().strength(-300))
         .force('center', d3.forceCenter(width / 2, height / 2 + 20))
         .force('collision', d3.forceCollide().radius(d => radiusScale(d.count) + 8));
 
+    // Keep nodes inside the drawing area; clamping the positions themselves
+    // keeps links, nodes and hit-testing in agreement
+    const clampNodes = () => {
+        for (const d of nodes) {
+            d.x = Math.max(50, Math.min(width - 50, d.x));
+            d.y = Math.max(70, Math.min(height - 30, d.y));
+        }
+    };
+
+    container.innerHTML = '';
+
+    // Large graphs: draw to one canvas instead of an SVG group per node
+    if (nodes.length > CANVAS_NODE_THRESHOLD) {
+        // Backing store at device pixels so HiDPI screens stay sharp; the
+        // scale keeps all drawing and hit-testing in CSS pixels
+        const dpr = window.devicePixelRatio || 1;
+        const canvas = d3.select('#visualization').append('canvas')
+            .attr('width', Math.round(width * dpr)).attr('height', Math.round(height * dpr))
+            .style('width', `${width}px`).style('height', `${height}px`).style('cursor', 'grab');
+        const ctx = canvas.node().getContext('2d');
+        ctx.scale(dpr, dpr);
+        const font = 'system-ui, -apple-system, sans-serif';
+
+        function draw() {
+            clampNodes();
+            ctx.clearRect(0, 0, width, height);
+            ctx.strokeStyle = '#e5e7eb';
+            for (const d of links) {
+                ctx.lineWidth = Math.sqrt(d.value) * 1.5;
+                ctx.beginPath();
+                ctx.moveTo(d.source.x, d.source.y);
+                ctx.lineTo(d.target.x, d.target.y);
+                ctx.stroke();
+            }
+            ctx.strokeStyle = '#fff';
+            ctx.lineWidth = 3;
+            for (const d of nodes) {
+                ctx.beginPath();
+                ctx.arc(d.x, d.y, radiusScale(d.count), 0, 2 * Math.PI);
+                ctx.fillStyle = color(d.group);
+                ctx.fill();
+                ctx.stroke();
+            }
+            ctx.fillStyle = '#111827';
+            ctx.font = `600 18px ${font}`;
+            ctx.fillText('Topic Clusters', 24, 32);
+            ctx.fillStyle = '#6b7280';
+            ctx.font = `13px ${font}`;
+            ctx.fillText(`${nodes.length} topics · ${links.length} connections`, 24, 52);
+            ctx.font = `12px ${font}`;
+            groupTypes.forEach((type, i) => {
+                ctx.beginPath();
+                ctx.arc(width - 140, 28 + i * 24, 6, 0, 2 * Math.PI);
+                ctx.fillStyle = color(i);
+                ctx.fill();
+                ctx.fillStyle = '#374151';
+                ctx.fillText(type, width - 126, 32 + i * 24);
+            });
+        }
+
+        // Hit-test through the simulation's quadtree instead of DOM events
+        const nodeAt = event => {
+            const [px, py] = d3.pointer(event, canvas.node());
+            return simulation.find(px, py, 40);
+        };
+        simulation.on('tick', draw);
+        canvas.call(d3.drag().subject(nodeAt).on('start', dragstarted).on('drag', dragged).on('end', dragended));
+        canvas.on('mousemove', function(event) {
+            const d = nodeAt(event);
+            if (!d) { hideTooltip(); return; }
+            showTooltip(event, d);
+        }).on('mouseleave', hideTooltip);
+        return;
+    }
+
+    const svg = d3.select('#visualization')
+        .append('svg')
+        .attr('width', width)
+        .attr('height', height)
+        .style('font-family', 'system-ui, -apple-system, sans-serif');
+
     // Links
     const link = svg.append('g').selectAll('line').data(links).enter().append('line')
         .attr('stroke', '#e5e7eb').attr('stroke-width', d => Math.sqrt(d.value) * 1.5);
@@ -152,44 +166,146 @@ class TopicClusterViz:
         .style('font-size', '12px')
         .style('font-weight', '500');
 
-    // Tooltip
-    const tooltip = d3.select('#visualization').append('div')
-        .style('position', 'absolute').style('background', '#1f2937').style('color', '#fff').style('padding', '12px 16px')
-        .style('border-radius', '8px').style('font-size', '13px').style('font-family', 'system-ui').style('box-shadow', '0 10px 25px -5px rgba(0,0,0,0.2)')
-        .style('pointer-events', 'none').style('opacity', 0).style('transition', 'opacity 0.15s').style('max-width', '200px');
-
     node.on('mouseover', function(event, d) {
         d3.select(this).select('circle').transition().duration(100).attr('stroke-width', 4);
-        tooltip.style('opacity', 1)
-            .html(`<div style="font-weight:600;margin-bottom:6px">${d.id}</div><div style="color:#9ca3af;font-size:11px;text-transform:uppercase;letter-spacing:0.5px;margin-bottom:4px">${d.type}</div><div style="color:#c4b5fd">${d.count} conversation${d.count !== 1 ? 's' : ''}</div>`)
-            .style('left', (event.pageX + 15) + 'px').style('top', (event.pageY - 60) + 'px');
+        showTooltip(event, d);
     }).on('mouseout', function() {
         d3.select(this).select('circle').transition().duration(100).attr('stroke-width', 3);
-        tooltip.style('opacity', 0);
+        hideTooltip();
     });
 
     // Title
     svg.append('text').attr('x', 24).attr('y', 32).attr('fill', '#111827').style('font-size', '18px').style('font-weight', '600').text('Topic Clusters');
     svg.append('text').attr('x', 24).attr('y', 52).attr('fill', '#6b7280').style('font-size', '13px').text(`${nodes.length} topics · ${links.length} connections`);
 
-    // Legend
-    const types = [...new Set(nodes.map(d => d.type))];
+    // Legend: DATA.types is already one entry per group, in group order
     const legend = svg.append('g').attr('transform', `translate(${width - 140}, 28)`);
-    legend.append('rect').attr('x', -12).attr('y', -12).attr('width', 130).attr('height', types.length * 24 + 16).attr('fill', '#f9fafb').attr('rx', 8);
-    types.forEach((type, i) => {
+    legend.append('rect').attr('x', -12).attr('y', -12).attr('width', 130).attr('height', groupTypes.length * 24 + 16).attr('fill', '#f9fafb').attr('rx', 8);
+    groupTypes.forEach((type, i) => {
         const g = legend.append('g').attr('transform', `translate(0, ${i * 24})`);
-        g.append('circle').attr('r', 6).attr('fill', color(nodes.find(n => n.type === type)?.group || 0));
+        g.append('circle').attr('r', 6).attr('fill', color(i));
         g.append('text').attr('x', 14).attr('y', 4).attr('fill', '#374151').style('font-size', '12px').text(type);
     });
 
     // Tick
     simulation.on('tick', () => {
+        clampNodes();
         link.attr('x1', d => d.source.x).attr('y1', d => d.source.y).attr('x2', d => d.target.x).attr('y2', d => d.target.y);
-        node.attr('transform', d => `translate(${Math.max(50, Math.min(width - 50, d.x))},${Math.max(70, Math.min(height - 30, d.y))})`);
+        node.attr('transform', d => `translate(${d.x},${d.y})`);
     });
 
     function dragstarted(event) { if (!event.active) simulation.alphaTarget(0.3).restart(); event.subject.fx = event.subject.x; event.subject.fy = event.subject.y; d3.select(this).style('cursor', 'grabbing'); }
     function dragged(event) { event.subject.fx = event.x; event.subject.fy = event.y; }
     function dragended(event) { if (!event.active) simulation.alphaTarget(0); event.subject.fx = null; event.subject.fy = null; d3.select(this).style('cursor', 'grab'); }
 })();
-"""
+""")
+
+
+class TopicClusterViz:
+    """D3.js force-directed graph showing topic clusters.
+
+    Expected data format (positional arrays keep the embedded JSON small):
+    {
+        "nodes": [["python", 1, 50], ...],  # [id, group, count]
+        "links": [[0, 3, 10], ...],  # [source index, target index, value]
+        "types": ["theme", "skill", ...]  # group index -> pattern type
+    }
+    """
+
+    @staticmethod
+    def prepare_data(
+        patterns: list[dict[str, Any]],
+        max_labels_per_conversation: int | None = 50,
+        min_cooccurrence: int = 1,
+        max_links: int | None = 2000,
+    ) -> dict[str, Any]:
+        """Convert patterns to topic cluster data.
+
+        Args:
+            patterns: List of pattern dicts with 'label', 'type', and 'conversation_ids'
+            max_labels_per_conversation: Cap on labels paired within one
+                conversation. Conversations touching more labels only link
+                their most frequent ones, bounding the quadratic pair count.
+                None disables the cap.
+            min_cooccurrence: Minimum shared conversations for a link
+            max_links: Keep only the strongest links; None keeps all
+
+        Returns:
+            Data dict with 'nodes', 'links' and 'types' for force-directed graph
+        """
+        if not patterns:
+            return {"nodes": [], "links": [], "types": []}
+
+        # Group patterns by type for coloring
+        type_to_group: dict[str, int] = {}
+        group_counter = 0
+
+        # Single pass builds nodes and the conversation -> labels index.
+        # Sets, so a conversation listed twice doesn't yield self-pairs.
+        nodes: list[list[Any]] = []
+        label_to_index: dict[str, int] = {}
+        conv_to_patterns: dict[str, set[str]] = defaultdict(set)
+        label_counts: Counter[str] = Counter()
+        for pattern in patterns:
+            label = pattern.get("label", "")
+            if not label:
+                continue
+
+            pattern_type = pattern.get("type", "unknown")
+            if pattern_type not in type_to_group:
+                type_to_group[pattern_type] = group_counter
+                group_counter += 1
+
+            # Count is based on number of conversations
+            conv_ids = pattern.get("conversation_ids", [])
+            if isinstance(conv_ids, list):
+                count = len(conv_ids)
+                # Patterns that appear in the same conversations are linked
+                for conv_id in conv_ids:
+                    conv_to_patterns[conv_id].add(label)
+            else:
+                count = 1
+            label_counts[label] += count
+
+            # A repeated label resolves to its last node, as d3 id lookup did
+            label_to_index[label] = len(nodes)
+            nodes.append([label, type_to_group[pattern_type], count])
+
+        # Count co-occurrences
+        link_counts: Counter[tuple[str, str]] = Counter()
+        for labels in conv_to_patterns.values():
+            if len(labels) < 2:
+                continue
+            if (
+                max_labels_per_conversation is not None
+                and len(labels) > max_labels_per_conversation
+            ):
+                # Keep the globally most frequent labels; ties by label
+                # so the result doesn't depend on set iteration order
+                labels = heapq.nlargest(
+                    max_labels_per_conversation,
+                    labels,
+                    key=lambda lbl: (label_counts[lbl], lbl),
+                )
+            # All pairs of patterns in this conversation; sorting first
+            # makes each (src, tgt) pair canonical without per-pair sorts
+            link_counts.update(combinations(sorted(labels), 2))
+
+        # Convert to links, strongest first (most_common uses a heap
+        # when capped, so only max_links pairs are ordered)
+        links = []
+        for (src, tgt), count in link_counts.most_common(max_links):
+            if count < min_cooccurrence:
+                break
+            links.append([label_to_index[src], label_to_index[tgt], count])
+
+        return {"nodes": nodes, "links": links, "types": list(type_to_group)}
+
+    @staticmethod
+    def get_js_code() -> str:
+        """Return D3.js code for topic cluster visualization.
+
+        The code expects DATA.nodes, DATA.links and DATA.types arrays
+        in the compact format produced by prepare_data.
+        """
+        return _JS_CODE
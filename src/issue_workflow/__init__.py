@@ -1,10 +1,24 @@
 """Issue workflow tool for agentic issue management."""
 
+from typing import TYPE_CHECKING
+
 from .state_manager import IssueStateManager
-from .workflow import IssueWorkflow, WorkflowResult
+
+if TYPE_CHECKING:
+    from .workflow import IssueWorkflow, WorkflowResult
 
 __all__ = [
     "IssueStateManager",
     "IssueWorkflow",
     "WorkflowResult",
 ]
+
+
+def __getattr__(name: str):
+    # Load the agent pipeline on first use so CLI commands that only touch
+    # drafts (report-bug, drafts) don't import it
+    if name in ("IssueWorkflow", "WorkflowResult"):
+        from . import workflow
+
+        return getattr(workflow, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,7 +12,6 @@ from pathlib import Path
 from shared import IssueReporter, IssueStatus
 
 from .state_manager import RUNTIME_PATHS
-from .workflow import IssueWorkflow
 
 
 def ensure_runtime_dirs() -> None:
@@ -39,6 +38,7 @@ def main() -> int:
         action="store_true",
         help="Auto-approve all human gates (non-interactive mode)",
     )
+    process_parser.set_defaults(func=handle_process)
 
     # list - show issues
     list_parser = subparsers.add_parser("list", help="List issues")
@@ -47,9 +47,11 @@ def main() -> int:
         choices=[s.value for s in IssueStatus],
         help="Filter by status",
     )
+    list_parser.set_defaults(func=handle_list)
 
     # clusters - show clusters
-    subparsers.add_parser("clusters", help="List issue clusters")
+    clusters_parser = subparsers.add_parser("clusters", help="List issue clusters")
+    clusters_parser.set_defaults(func=handle_clusters)
 
     # approve - approve cluster for resolution
     approve_parser = subparsers.add_parser(
@@ -57,90 +59,117 @@ def main() -> int:
         help="Approve cluster for resolution",
     )
     approve_parser.add_argument("cluster_id", help="Cluster ID to approve")
+    approve_parser.set_defaults(func=handle_approve)
 
     # defer - defer an issue
     defer_parser = subparsers.add_parser("defer", help="Defer an issue")
     defer_parser.add_argument("issue_id", help="Issue ID to defer")
+    defer_parser.set_defaults(func=handle_defer)
 
     # wontfix - mark issue as won't fix
     wontfix_parser = subparsers.add_parser("wontfix", help="Mark issue as won't fix")
     wontfix_parser.add_argument("issue_id", help="Issue ID to mark")
+    wontfix_parser.set_defaults(func=handle_wontfix)
 
     # report-bug - interactive bug report creation
-    subparsers.add_parser("report-bug", help="Report a bug interactively")
+    report_parser = subparsers.add_parser("report-bug", help="Report a bug interactively")
+    report_parser.set_defaults(func=lambda args: handle_report_bug())
 
     # drafts - list pending drafts
-    subparsers.add_parser("drafts", help="List pending draft issues")
+    drafts_parser = subparsers.add_parser("drafts", help="List pending draft issues")
+    drafts_parser.set_defaults(func=lambda args: handle_list_drafts())
 
     args = parser.parse_args()
+    return args.func(args)
 
-    if args.command == "process":
-        workflow = IssueWorkflow(auto_approve=args.yes)
-        result = workflow.process()
-        print(f"\n{result.message}")
-        return 0 if result.success else 1
-
-    workflow = IssueWorkflow()
-
-    if args.command == "list":
-        status = IssueStatus(args.status) if args.status else None
-        issues = workflow.list_issues(status)
-
-        if not issues:
-            print("No issues found.")
-            return 0
-
-        print(f"\n{'ID':<14} {'Status':<12} {'Severity':<10} {'Title'}")
-        print("-" * 70)
-        for issue in issues:
-            title = issue.title[:35]
-            # Handle both enum and string (due to use_enum_values=True)
-            issue_status = str(issue.status.value if hasattr(issue.status, "value") else issue.status)
-            issue_severity = str(issue.severity.value if hasattr(issue.severity, "value") else issue.severity) if issue.severity else "unknown"
-            print(f"{issue.id:<14} {issue_status:<12} {issue_severity:<10} {title}")
-        print(f"\nTotal: {len(issues)} issues")
+
+# Workflow commands import IssueWorkflow lazily, so report-bug and drafts
+# don't pay for loading the agent pipeline.
+
+
+def handle_process(args: argparse.Namespace) -> int:
+    """Run the full pipeline."""
+    from .workflow import IssueWorkflow
+
+    workflow = IssueWorkflow(auto_approve=args.yes)
+    result = workflow.process()
+    print(f"\n{result.message}")
+    return 0 if result.success else 1
+
+
+def handle_list(args: argparse.Namespace) -> int:
+    """List issues, optionally filtered by status."""
+    from .workflow import IssueWorkflow
+
+    status = IssueStatus(args.status) if args.status else None
+    issues = IssueWorkflow().list_issues(status)
+
+    if not issues:
+        print("No issues found.")
         return 0
 
-    elif args.command == "clusters":
-        clusters = workflow.list_clusters()
-
-        if not clusters:
-            print("No clusters found.")
-            return 0
-
-        print(f"\n{'ID':<20} {'Status':<12} {'Priority':<10} {'Theme'}")
-        print("-" * 80)
-        for cluster in clusters:
-            theme = cluster.theme[:35] if cluster.theme else "(no theme)"
-            print(
-                f"{cluster.id:<20} {cluster.status:<12} "
-                f"{cluster.aggregate_priority:<10.2f} {theme}"
-            )
-        print(f"\nTotal: {len(clusters)} clusters")
+    # Build the table and write it once rather than one print per row
+    rows = [f"\n{'ID':<14} {'Status':<12} {'Severity':<10} {'Title'}", "-" * 70]
+    for issue in issues:
+        title = issue.title[:35]
+        # Handle both enum and string (due to use_enum_values=True); checked
+        # per field, since a mutated issue can hold an enum next to strings
+        issue_status = getattr(issue.status, "value", issue.status)
+        issue_severity = getattr(issue.severity, "value", issue.severity) if issue.severity else "unknown"
+        rows.append(f"{issue.id:<14} {issue_status:<12} {issue_severity:<10} {title}")
+    rows.append(f"\nTotal: {len(issues)} issues\n")
+    sys.stdout.write("\n".join(rows))
+    return 0
+
+
+def handle_clusters(args: argparse.Namespace) -> int:
+    """List issue clusters."""
+    from .workflow import IssueWorkflow
+
+    clusters = IssueWorkflow().list_clusters()
+
+    if not clusters:
+        print("No clusters found.")
         return 0
 
-    elif args.command == "approve":
-        result = workflow.approve_cluster(args.cluster_id)
-        print(result.message)
-        return 0 if result.success else 1
+    # Build the table and write it once rather than one print per row
+    rows = [f"\n{'ID':<20} {'Status':<12} {'Priority':<10} {'Theme'}", "-" * 80]
+    for cluster in clusters:
+        theme = cluster.theme[:35] if cluster.theme else "(no theme)"
+        rows.append(
+            f"{cluster.id:<20} {cluster.status:<12} "
+            f"{cluster.aggregate_priority:<10.2f} {theme}"
+        )
+    rows.append(f"\nTotal: {len(clusters)} clusters\n")
+    sys.stdout.write("\n".join(rows))
+    return 0
+
+
+def handle_approve(args: argparse.Namespace) -> int:
+    """Approve a cluster for resolution."""
+    from .workflow import IssueWorkflow
+
+    result = IssueWorkflow().approve_cluster(args.cluster_id)
+    print(result.message)
+    return 0 if result.success else 1
+
 
-    elif args.command == "defer":
-        result = workflow.defer_issue(args.issue_id)
-        print(result.message)
-        return 0 if result.success else 1
+def handle_defer(args: argparse.Namespace) -> int:
+    """Defer an issue."""
+    from .workflow import IssueWorkflow
 
-    elif args.command == "wontfix":
-        result = workflow.wontfix_issue(args.issue_id)
-        print(result.message)
-        return 0 if result.success else 1
+    result = IssueWorkflow().defer_issue(args.issue_id)
+    print(result.message)
+    return 0 if result.success else 1
 
-    elif args.command == "report-bug":
-        return handle_report_bug()
 
-    elif args.command == "drafts":
-        return handle_list_drafts()
+def handle_wontfix(args: argparse.Namespace) -> int:
+    """Mark an issue as won't fix."""
+    from .workflow import IssueWorkflow
 
-    return 1
+    result = IssueWorkflow().wontfix_issue(args.issue_id)
+    print(result.message)
+    return 0 if result.success else 1
 
 
 def handle_report_bug() -> int:
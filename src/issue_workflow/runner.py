@@ -6,19 +6,29 @@ Uses subscription pricing instead of API per-token costs.
 See ADR-006 for migration rationale.
 """
 
-import json
 import logging
 import re
 import subprocess
+import tempfile
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import from_json
+
 logger = logging.getLogger(__name__)
 
+# Fenced code blocks that may hold JSON, tried in order
+_JSON_BLOCK_PATTERNS = (
+    re.compile(r"```json\s*\n([\s\S]*?)\n```"),  # ```json ... ```
+    re.compile(r"```\s*\n([\s\S]*?)\n```"),  # ``` ... ```
+)
+
 
-def _extract_json_from_markdown(text: str) -> str | None:
-    """Extract JSON from markdown code blocks.
+def _parse_json_from_markdown(text: str) -> Any:
+    """Parse JSON from markdown code blocks.
 
     Handles formats like:
     ```json
@@ -29,26 +39,38 @@ def _extract_json_from_markdown(text: str) -> str | None:
     {...}
     ```
 
-    Returns the first valid JSON found, or None.
+    Returns the first valid JSON found, already parsed, or None.
     """
-    # Try to find JSON in code blocks
-    patterns = [
-        r"```json\s*\n([\s\S]*?)\n```",  # ```json ... ```
-        r"```\s*\n([\s\S]*?)\n```",  # ``` ... ```
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
+    # Try to find JSON in code blocks; finditer stops at the first valid one
+    for pattern in _JSON_BLOCK_PATTERNS:
+        for match in pattern.finditer(text):
             try:
-                json.loads(match.strip())
-                return match.strip()
-            except json.JSONDecodeError:
+                return from_json(match.group(1).strip())
+            except ValueError:
                 continue
 
     return None
 
 
+def _read_result_event(lines: Iterable[str]) -> dict | None:
+    """Return the first type='result' event from newline-delimited JSON.
+
+    Other events (system, assistant, tool use) are parsed and dropped as
+    they arrive, so memory stays bounded by the largest single event.
+    Non-JSON lines are skipped.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            event = from_json(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict) and event.get("type") == "result":
+            return event
+    return None
+
+
 @dataclass
 class RunResult:
     """Result from Claude Code CLI execution."""
@@ -58,13 +80,15 @@ class RunResult:
     error: str | None = None
     usage: dict | None = None
     parsed_data: dict | None = None  # Parsed JSON if output was valid JSON
+    session_id: str | None = None  # CLI session, for resume_session
 
 
 class ClaudeCodeRunner:
     """Run Claude Code CLI in non-interactive mode.
 
     Uses `claude -p` for single-shot execution with JSON output.
-    Each invocation is a fresh session (no cross-step memory).
+    Each invocation is a fresh session (no cross-step memory) unless
+    resume_session continues an earlier one.
     """
 
     def __init__(self, cwd: Path | None = None, max_turns: int = 10):
@@ -83,6 +107,8 @@ class ClaudeCodeRunner:
         allowed_tools: list[str] | None = None,
         timeout: int | None = 300,
         expected_fields: list[str] | None = None,
+        system_prompt: str | None = None,
+        resume_session: str | None = None,
     ) -> RunResult:
         """Execute claude -p and return result.
 
@@ -92,6 +118,13 @@ class ClaudeCodeRunner:
             timeout: Timeout in seconds. Default 5 minutes.
             expected_fields: List of field names to validate in JSON response.
                 If provided, logs a warning when fields are missing.
+            system_prompt: Static instructions appended to the CLI's system
+                prompt. Keeping them out of `prompt` leaves an identical
+                prefix across calls, which the API can serve from its
+                prompt cache.
+            resume_session: Session ID from an earlier RunResult to continue
+                instead of starting a fresh session; `prompt` is then sent
+                as the next user turn.
 
         Returns:
             RunResult with success status, output, and optional error/usage info.
@@ -100,107 +133,122 @@ class ClaudeCodeRunner:
             "claude",
             "-p",
             prompt,
+            # Newline-delimited events, so the result can be picked out as
+            # it arrives instead of buffering the whole session transcript.
+            # The CLI requires --verbose for stream-json in print mode.
             "--output-format",
-            "json",
+            "stream-json",
+            "--verbose",
             "--max-turns",
             str(self.max_turns),
         ]
 
         if allowed_tools:
             cmd.extend(["--allowedTools", ",".join(allowed_tools)])
+        if system_prompt:
+            cmd.extend(["--append-system-prompt", system_prompt])
 
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self.cwd,
-                timeout=timeout,
-            )
-        except subprocess.TimeoutExpired:
-            return RunResult(
-                success=False,
-                output="",
-                error=f"Timeout after {timeout} seconds",
-            )
-        except FileNotFoundError:
+        if resume_session:
+            cmd.extend(["--resume", resume_session])
+
+        # stderr goes to a temp file so a chatty CLI can't fill the pipe
+        # and block while we are still reading stdout
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    text=True,
+                    cwd=self.cwd,
+                )
+            except FileNotFoundError:
+                return RunResult(
+                    success=False,
+                    output="",
+                    error="Claude Code CLI not found. Install with: npm install -g @anthropic-ai/claude-code",
+                )
+
+            # Read on a worker thread so the timeout holds even if a
+            # grandchild process keeps the stdout pipe open after a kill
+            events: list[dict | None] = []
+
+            def _consume(stream: Iterable[str]) -> None:
+                events.append(_read_result_event(stream))
+                # Drain anything after the result so the CLI can't block
+                # on a full pipe; lines are discarded, not buffered
+                for _ in stream:
+                    pass
+
+            reader = threading.Thread(target=_consume, args=(proc.stdout,), daemon=True)
+            reader.start()
+            reader.join(timeout)
+            if reader.is_alive():
+                proc.kill()
+                proc.wait()
+                # The kill ends the stream, so the reader finishes and the
+                # pipe can be closed. If a grandchild still holds the pipe
+                # open, the reader stays blocked (closing under it would
+                # block too) and is left to exit as a daemon.
+                reader.join(5)
+                if not reader.is_alive():
+                    proc.stdout.close()
+                return RunResult(
+                    success=False,
+                    output="",
+                    error=f"Timeout after {timeout} seconds",
+                )
+            proc.wait()
+            proc.stdout.close()
+            result_event = events[0] if events else None
+
+            if proc.returncode != 0:
+                stderr_file.seek(0)
+                return RunResult(
+                    success=False,
+                    output="",
+                    error=stderr_file.read() or f"Exit code {proc.returncode}",
+                )
+
+        if result_event is None:
             return RunResult(
                 success=False,
                 output="",
-                error="Claude Code CLI not found. Install with: npm install -g @anthropic-ai/claude-code",
+                error="No result event in CLI output",
             )
 
-        if result.returncode != 0:
+        output = result_event.get("result", "")
+        usage = result_event.get("usage")
+        if result_event.get("is_error", False):
             return RunResult(
                 success=False,
-                output="",
-                error=result.stderr or f"Exit code {result.returncode}",
+                output=output,
+                error=output or "Agent returned error",
             )
 
-        try:
-            data = json.loads(result.stdout)
-
-            # Claude CLI returns a JSON array with multiple event objects.
-            # Find the result event (type='result') to extract output.
-            if isinstance(data, list):
-                result_event = next(
-                    (item for item in data if item.get("type") == "result"),
-                    None,
-                )
-                if result_event is None:
-                    return RunResult(
-                        success=False,
-                        output="",
-                        error="No result event in CLI output",
-                    )
-                output = result_event.get("result", "")
-                usage = result_event.get("usage")
-                is_error = result_event.get("is_error", False)
-                if is_error:
-                    return RunResult(
-                        success=False,
-                        output=output,
-                        error=output or "Agent returned error",
+        # Try to parse agent output as JSON for validation
+        parsed_data = None
+        if output:
+            # First try direct JSON parse
+            try:
+                parsed_data = from_json(output)
+            except ValueError:
+                # Fall back to JSON in markdown code blocks, parsed once
+                parsed_data = _parse_json_from_markdown(output)
+
+            # Validate expected fields if specified
+            if parsed_data and expected_fields and isinstance(parsed_data, dict):
+                missing = [f for f in expected_fields if f not in parsed_data]
+                if missing:
+                    logger.warning(
+                        "Agent response missing expected fields: %s",
+                        ", ".join(missing),
                     )
-            else:
-                # Fallback for dict format (legacy or future changes)
-                output = data.get("result", "")
-                usage = data.get("usage")
-
-            # Try to parse agent output as JSON for validation
-            parsed_data = None
-            if output:
-                # First try direct JSON parse
-                try:
-                    parsed_data = json.loads(output)
-                except json.JSONDecodeError:
-                    # Try extracting JSON from markdown code blocks
-                    extracted = _extract_json_from_markdown(output)
-                    if extracted:
-                        try:
-                            parsed_data = json.loads(extracted)
-                        except json.JSONDecodeError:
-                            pass
-
-                # Validate expected fields if specified
-                if parsed_data and expected_fields and isinstance(parsed_data, dict):
-                    missing = [f for f in expected_fields if f not in parsed_data]
-                    if missing:
-                        logger.warning(
-                            "Agent response missing expected fields: %s",
-                            ", ".join(missing),
-                        )
 
-            return RunResult(
-                success=True,
-                output=output,
-                usage=usage,
-                parsed_data=parsed_data,
-            )
-        except json.JSONDecodeError as e:
-            # Sometimes output isn't JSON (error messages, etc.)
-            return RunResult(
-                success=False,
-                output=result.stdout,
-                error=f"JSON parse error: {e}",
-            )
+        return RunResult(
+            success=True,
+            output=output,
+            usage=usage,
+            parsed_data=parsed_data,
+            session_id=result_event.get("session_id"),
+        )
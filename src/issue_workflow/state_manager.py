@@ -1,12 +1,16 @@
 """Issue state management for the workflow."""
 
 import json
+import os
 import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from enum import Enum
 from pathlib import Path
 
 from pydantic import ValidationError
+from pydantic_core import to_json
 
 from shared import Issue, IssueState, IssueStatus
 
@@ -19,6 +23,12 @@ RUNTIME_PATHS = {
     "state": RUNTIME_BASE / "issue-state.json",
 }
 
+# Serialize through pydantic-core directly: same Rust encoder that
+# model_dump_json wraps, minus the Python-level kwargs plumbing
+_STATE_SER = IssueState.__pydantic_serializer__
+_STATE_VALIDATOR = IssueState.__pydantic_validator__
+_ISSUE_SER = Issue.__pydantic_serializer__
+
 
 @dataclass
 class IssueStateManager:
@@ -29,6 +39,9 @@ class IssueStateManager:
     state_path: Path = field(default_factory=lambda: RUNTIME_PATHS["state"])
     drafts_dir: Path = field(default_factory=lambda: RUNTIME_PATHS["drafts"])
     issues_dir: Path = field(default_factory=lambda: RUNTIME_PATHS["issues"])
+    _parent_ensured: bool = field(default=False, init=False, repr=False)
+    # (expires_at, "## YYYY-MM-DD\n") for the current local day
+    _today_cache: tuple[float, str] | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.drafts_dir.mkdir(parents=True, exist_ok=True)
@@ -36,15 +49,31 @@ class IssueStateManager:
 
     def load(self) -> IssueState:
         """Load existing state or create new."""
-        if not self.state_path.exists():
+        # One open() instead of exists() + read: no extra stat, no race
+        # with a concurrent save() replacing the file in between
+        try:
+            raw = self.state_path.read_bytes()
+        except FileNotFoundError:
             return IssueState()
 
+        # Fast path: current-version state parses and validates in one
+        # pydantic-core pass, without an intermediate Python dict.
+        try:
+            state = _STATE_VALIDATOR.validate_json(raw)
+            if (
+                "schema_version" in state.model_fields_set
+                and state.schema_version >= self.CURRENT_VERSION
+            ):
+                return state
+        except ValidationError:
+            pass  # Old schema or corrupt; handled below
+
         try:
-            data = json.loads(self.state_path.read_text())
+            data = json.loads(raw)
             version = data.get("schema_version", 0)
             if version < self.CURRENT_VERSION:
                 data = self._migrate(data, version)
-            return IssueState.model_validate(data)
+            return _STATE_VALIDATOR.validate_python(data)
         except (json.JSONDecodeError, ValidationError) as e:
             backup = self.state_path.with_suffix(".json.corrupt")
             self.state_path.rename(backup)
@@ -56,17 +85,42 @@ class IssueStateManager:
             return IssueState()
 
     def save(self, state: IssueState) -> None:
-        """Persist state atomically."""
-        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        """Persist state atomically.
+
+        The temp file is fsynced before os.replace swaps it in, and the
+        directory after, so a crash leaves either the old state or the
+        complete new one on disk.
+        """
+        if not self._parent_ensured:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            self._parent_ensured = True
+        # Compact JSON: state is machine-read (the CLI lists it), so skip
+        # the indentation whitespace on every rewrite
+        payload = _STATE_SER.to_json(state)
         tmp = self.state_path.with_suffix(".json.tmp")
-        tmp.write_text(state.model_dump_json(indent=2))
-        tmp.rename(self.state_path)
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.state_path)
+
+        # Persist the rename itself (directories can't be opened on Windows)
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(self.state_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
     def _migrate(self, data: dict, from_version: int) -> dict:
         """Migrate state from older schema versions."""
         # v1 → v2: Remove sanitized_* fields, move content to title/description
-        if from_version < 2:
-            for issue_data in data.get("issues", {}).values():
+        issues = data.get("issues", {})
+        # Clean v1 files (no sanitized_* keys) need only the version bump
+        if from_version < 2 and any(
+            "sanitized_title" in d or "sanitized_description" in d for d in issues.values()
+        ):
+            for issue_data in issues.values():
                 if issue_data.get("sanitized_title"):
                     # Preserve raw in context, use sanitized as title
                     if issue_data.get("title") != issue_data["sanitized_title"]:
@@ -104,7 +158,7 @@ class IssueStateManager:
         # Save to drafts directory
         filename = f"draft_{issue.created.strftime('%Y%m%d_%H%M%S')}_{issue.id}.json"
         filepath = self.drafts_dir / filename
-        filepath.write_text(issue.model_dump_json(indent=2))
+        filepath.write_bytes(_ISSUE_SER.to_json(issue, indent=2))
 
         # Add to state
         state = self.load()
@@ -131,6 +185,14 @@ class IssueStateManager:
         Atomic: state is saved before file is deleted, so a crash
         leaves the draft file intact for retry.
         """
+        state = self.load()
+        issue = self._import_draft_into(state, draft_path)
+        self.save(state)  # Commit to state first
+        draft_path.unlink()  # Then delete source
+        return issue
+
+    def _import_draft_into(self, state: IssueState, draft_path: Path) -> Issue:
+        """Parse a draft file and add it to an in-memory state."""
         data = json.loads(draft_path.read_text())
 
         # Extract ID from filename (e.g., draft_20251228_115557_80e98398.json)
@@ -152,31 +214,58 @@ class IssueStateManager:
             created=created or datetime.now(),
         )
 
-        state = self.load()
         state.issues[issue.id] = issue
-        self.save(state)  # Commit to state first
-        draft_path.unlink()  # Then delete source
         return issue
 
-    def import_all_drafts(self) -> list[Issue]:
+    def import_all_drafts(self, state: IssueState | None = None) -> list[Issue]:
         """Import all draft files from issue-drafts directory.
 
-        Returns list of imported issues. Already-imported issues are skipped.
+        Returns list of imported issues. Already-imported issues are skipped,
+        as are draft files that can't be read or parsed (with a warning).
+        State is loaded (unless passed in) and saved once for the whole
+        batch; draft files are deleted only after that save, so a crash
+        leaves them for retry.
         """
-        imported = []
-        state = self.load()
+        with os.scandir(self.drafts_dir) as it:
+            names = [
+                e.name for e in it
+                if e.name.startswith("draft_") and e.name.endswith(".json")
+            ]
+        if not names:
+            return []  # Nothing to import; don't parse state at all
 
-        for path in self.drafts_dir.glob("draft_*.json"):
-            # Extract ID from filename
-            parts = path.stem.split("_")
+        imported = []
+        imported_paths = []
+        if state is None:
+            state = self.load()
+        existing_ids = state.issues.keys()
+
+        for name in names:
+            path = self.drafts_dir / name
+            # Extract ID from filename (draft_<date>_<time>_<id>.json)
+            parts = name[:-5].split("_")
             if len(parts) >= 4:
-                issue_id = parts[-1]
                 # Skip if already in state
-                if issue_id in state.issues:
+                if parts[-1] in existing_ids:
                     path.unlink()  # Clean up duplicate file
                     continue
 
-            imported.append(self.import_draft(path))
+            # A bad file is skipped, not fatal: the rest of the batch still
+            # lands in the single save below, and the file stays for a look
+            try:
+                imported.append(self._import_draft_into(state, path))
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(
+                    f"WARNING: Skipping unreadable draft {path} ({type(e).__name__}: {e})",
+                    file=sys.stderr,
+                )
+                continue
+            imported_paths.append(path)
+
+        if imported:
+            self.save(state)  # Commit to state first
+            for path in imported_paths:
+                path.unlink()  # Then delete sources
 
         return imported
 
@@ -198,55 +287,89 @@ class IssueStateManager:
             "category": issue.category,
             "tags": issue.tags,
             "affected_files": issue.affected_files,
-            "severity": str(sev.value if hasattr(sev, "value") else sev) if sev else "unknown",
+            "severity": (sev.value if isinstance(sev, Enum) else sev) if sev else "unknown",
             "frequency": issue.frequency,
-            "created": issue.created.isoformat(),
+            # to_json encodes datetimes in the same ISO form as isoformat()
+            "created": issue.created,
         }
 
         filename = f"issue_{issue.id}.json"
         filepath = self.issues_dir / filename
-        filepath.write_text(json.dumps(public_data, indent=2))
+        filepath.write_bytes(to_json(public_data, indent=2))
         return filepath
 
     def resolve_issue(self, issue_id: str, notes: str, resolved_by: str) -> None:
         """Mark issue as resolved and update changelog."""
+        self.resolve_issues_bulk([(issue_id, notes, resolved_by)])
+
+    def resolve_issues_bulk(self, items: list[tuple[str, str, str]]) -> None:
+        """Resolve several issues with one state save and one changelog write.
+
+        Every id is checked before anything changes, so an unknown id
+        raises ValueError with neither state nor changelog touched.
+
+        Args:
+            items: (issue_id, notes, resolved_by) tuples, in resolution order
+        """
         state = self.load()
-        if issue_id not in state.issues:
-            raise ValueError(f"Issue {issue_id} not found")
-
-        issue = state.issues[issue_id]
-        issue.status = IssueStatus.resolved
-        issue.resolution_notes = notes
-        issue.resolved_by = resolved_by
-        issue.updated = datetime.now()
+        for issue_id, _, _ in items:
+            if issue_id not in state.issues:
+                raise ValueError(f"Issue {issue_id} not found")
+
+        now = datetime.now()
+        entries = []
+        for issue_id, notes, resolved_by in items:
+            issue = state.issues[issue_id]
+            issue.status = IssueStatus.resolved
+            issue.resolution_notes = notes
+            issue.resolved_by = resolved_by
+            issue.updated = now
+            entries.append(f"- **{issue_id}**: {notes}\n")
         self.save(state)
 
-        self._append_changelog(issue, notes)
+        # Newest entry goes first, matching one-at-a-time appends
+        if entries:
+            self._append_changelog_block("".join(reversed(entries)))
 
         # Remove from public issues dir
-        public_file = self.issues_dir / f"issue_{issue_id}.json"
-        if public_file.exists():
-            public_file.unlink()
-
-    def _append_changelog(self, issue: Issue, notes: str) -> None:
-        """Append resolution to CHANGELOG.md."""
+        for issue_id, _, _ in items:
+            (self.issues_dir / f"issue_{issue_id}.json").unlink(missing_ok=True)
+
+    def _today_header(self) -> str:
+        """Changelog section header for today, cached until local midnight."""
+        now = time.time()
+        cached = self._today_cache
+        if cached is None or now >= cached[0]:
+            today = date.fromtimestamp(now)
+            midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+            cached = self._today_cache = (midnight.timestamp(), f"## {today.isoformat()}\n")
+        return cached[1]
+
+    def _append_changelog_block(self, entry: str) -> None:
+        """Insert one or more entry lines under today's CHANGELOG.md header."""
         changelog_path = self.issues_dir / "CHANGELOG.md"
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        entry = f"- **{issue.id}**: {notes}\n"
+        today_header = self._today_header()
 
-        if changelog_path.exists():
+        try:
             content = changelog_path.read_text()
-            if f"## {today}" in content:
-                parts = content.split(f"## {today}\n", 1)
-                content = f"{parts[0]}## {today}\n{entry}{parts[1]}"
+        except FileNotFoundError:
+            content = None
+
+        if content is not None:
+            # Sections are newest-first, so today's header can only be the
+            # first "## " header; check there instead of scanning the file
+            first = content.find("\n## ") + 1
+            if first and content.startswith(today_header, first):
+                at = first + len(today_header)
+                content = f"{content[:at]}{entry}{content[at:]}"
             else:
                 lines = content.split("\n", 2)
                 if len(lines) >= 2:
-                    content = f"{lines[0]}\n\n## {today}\n{entry}\n{lines[2] if len(lines) > 2 else ''}"
+                    content = f"{lines[0]}\n\n{today_header}{entry}\n{lines[2] if len(lines) > 2 else ''}"
                 else:
-                    content = f"# Issue Changelog\n\n## {today}\n{entry}"
+                    content = f"# Issue Changelog\n\n{today_header}{entry}"
         else:
-            content = f"# Issue Changelog\n\n## {today}\n{entry}"
+            content = f"# Issue Changelog\n\n{today_header}{entry}"
 
         changelog_path.write_text(content)
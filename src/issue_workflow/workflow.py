@@ -9,43 +9,106 @@ See ADR-006 for migration rationale.
 Agent prompts are loaded from .claude/agents/*.md files at runtime.
 """
 
-import json
-import re
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from shared import Issue, IssueCluster, IssueSeverity, IssueStatus
+from pydantic_core import to_json
+
+from shared import Issue, IssueCluster, IssueSeverity, IssueState, IssueStatus
 
 from .runner import ClaudeCodeRunner
 from .state_manager import IssueStateManager
 
 
+_APPROVAL_MESSAGE = (
+    "Human approved the plan. Proceed with implementation. "
+    "Implementation phase only; do not re-plan."
+)
+
+
 def _parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     """Parse YAML frontmatter from markdown content.
 
     Returns (frontmatter_dict, body_markdown).
-    Uses regex to avoid adding pyyaml dependency.
+    Splits on the --- fences by hand to avoid adding pyyaml dependency.
     """
-    match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
-    if not match:
+    if not content.startswith("---\n"):
+        return {}, content
+    end = content.find("\n---\n", 4)
+    if end == -1:
         return {}, content
-
-    frontmatter_text, body = match.groups()
 
     # Simple YAML parsing for flat key: value pairs
     frontmatter: dict[str, Any] = {}
-    for line in frontmatter_text.strip().split("\n"):
-        if ":" in line:
-            key, value = line.split(":", 1)
+    for line in content[4:end].splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
             value = value.strip()
             # Handle comma-separated lists (tools: Read, Grep, Glob)
             if "," in value:
                 value = [v.strip() for v in value.split(",")]
             frontmatter[key.strip()] = value
 
-    return frontmatter, body.strip()
+    return frontmatter, content[end + 5:].strip()
+
+
+def _task_json(obj: Any) -> str:
+    """Serialize models for an agent prompt as compact JSON.
+
+    pydantic-core encodes the models directly (same output as
+    model_dump(mode="json")); no indentation, since only the agent reads it.
+    """
+    return to_json(obj).decode()
+
+
+# Statuses whose triage output is still current enough to reuse; closed or
+# deferred issues may have been triaged against code that has since changed
+_REUSABLE_TRIAGE_STATUSES = frozenset(
+    {IssueStatus.triaged, IssueStatus.clustered, IssueStatus.prioritized}
+)
+
+
+def _raw_content_key(issue: Issue) -> tuple[str, str]:
+    """(title, description) as reported, before triage sanitized them."""
+    return (
+        issue.context.get("raw_title", issue.title),
+        issue.context.get("raw_description", issue.description),
+    )
+
+
+def _triage_output_of(issue: Issue) -> dict[str, Any]:
+    """A triaged issue's fields in the shape the triage agent returns."""
+    data: dict[str, Any] = {
+        "title": issue.title,
+        "description": issue.description,
+        "affected_files": list(issue.affected_files),
+        "tags": list(issue.tags),
+    }
+    if issue.severity:
+        data["severity"] = issue.severity
+    return data
+
+
+def _apply_triage(issue: Issue, issue_data: dict[str, Any], now: datetime) -> None:
+    """Apply one triage result to an issue and mark it triaged."""
+    # Overwrite with sanitized content (preserve raw in context)
+    if "title" in issue_data and issue_data["title"] != issue.title:
+        issue.context["raw_title"] = issue.title
+        issue.title = issue_data["title"]
+    if "description" in issue_data and issue_data["description"] != issue.description:
+        issue.context["raw_description"] = issue.description
+        issue.description = issue_data["description"]
+    if "affected_files" in issue_data:
+        issue.affected_files = issue_data["affected_files"]
+    if "tags" in issue_data:
+        issue.tags = issue_data["tags"]
+    if "severity" in issue_data:
+        issue.severity = IssueSeverity(issue_data["severity"])
+    issue.status = IssueStatus.triaged
+    issue.updated = now
 
 
 @dataclass
@@ -68,16 +131,29 @@ class IssueWorkflow:
         self.auto_approve = auto_approve
         self.state_manager = IssueStateManager()
         self._runner = ClaudeCodeRunner(cwd=self.cwd, max_turns=10)
+        # agent_name -> (mtime_ns, tools, body)
+        self._agent_cache: dict[str, tuple[int, list[str], str]] = {}
+        # CLI session of the most recent successful _run_agent call
+        self._last_session_id: str | None = None
 
     def _load_agent_config(self, agent_name: str) -> tuple[list[str], str]:
         """Load tools and prompt from .claude/agents/{agent_name}.md.
 
+        Parsed configs are cached per instance and re-read only when the
+        file's mtime changes.
+
         Returns:
             (tools_list, system_prompt_markdown)
         """
         path = self.cwd / ".claude" / "agents" / f"{agent_name}.md"
-        if not path.exists():
-            raise FileNotFoundError(f"Agent config not found: {path}")
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Agent config not found: {path}") from None
+
+        cached = self._agent_cache.get(agent_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1]), cached[2]
 
         content = path.read_text()
         frontmatter, body = _parse_frontmatter(content)
@@ -86,53 +162,88 @@ class IssueWorkflow:
         if isinstance(tools, str):
             tools = [tools]
 
-        return tools, body
+        self._agent_cache[agent_name] = (mtime_ns, tools, body)
+        return list(tools), body
 
     def _run_agent(
         self,
         agent_name: str,
-        task_context: str,
+        task_context: str | None = None,
         *,
         approved: bool = False,
+        resume_session: str | None = None,
     ) -> dict | list | None:
         """Run an agent via Claude Code CLI.
 
         Args:
             agent_name: Name of the agent (maps to .claude/agents/*.md).
-            task_context: Task-specific context (data to process).
+            task_context: Task-specific context (data to process); required
+                unless resume_session is given.
             approved: If True, append approval suffix to prompt.
+            resume_session: Continue this CLI session instead of starting
+                fresh. The session already holds the task, so only the
+                approval message is sent; pass no task_context.
 
         Returns:
             Parsed agent response (dict or list), or None on failure.
         """
         tools, system_prompt = self._load_agent_config(agent_name)
 
-        prompt = f"{system_prompt}\n\n## Current Task\n\n{task_context}"
-
-        if approved:
-            prompt += "\n\nHuman approved the plan. Proceed with implementation."
-
-        result = self._runner.run(prompt, allowed_tools=tools)
+        # The agent body goes in the system prompt so every call to the
+        # same agent shares a cacheable prefix; only the task varies
+        if resume_session:
+            prompt = _APPROVAL_MESSAGE
+        else:
+            prompt = f"## Current Task\n\n{task_context}"
+            if approved:
+                prompt += f"\n\n{_APPROVAL_MESSAGE}"
+
+        result = self._runner.run(
+            prompt,
+            allowed_tools=tools,
+            system_prompt=system_prompt,
+            resume_session=resume_session,
+        )
 
         if not result.success:
             print(f"Agent {agent_name} failed: {result.error}")
             return None
 
+        self._last_session_id = result.session_id
         print(result.output)
         return result.parsed_data
 
+    def _refresh(self, state: IssueState) -> None:
+        """Reload `state` in place from disk before applying an agent result.
+
+        Agent runs take minutes, and edits saved from another shell in the
+        meantime (defer, wontfix, approve, ...) must survive this stage's
+        save. Updating in place keeps the object process() threads through
+        the stages current.
+        """
+        fresh = self.state_manager.load()
+        for name in type(state).model_fields:
+            setattr(state, name, getattr(fresh, name))
+
     # ========================================================================
     # Pipeline Steps
     # ========================================================================
 
-    def run_triage(self) -> WorkflowResult:
-        """Run triage agent on all draft issues."""
+    def run_triage(self, state: IssueState | None = None) -> WorkflowResult:
+        """Run triage agent on all draft issues.
+
+        Pass `state` to work on an already-loaded state instead of
+        reloading it from disk; it is still saved when the step finishes.
+        """
+        if state is None:
+            state = self.state_manager.load()
+
         # Import any loose draft files into state first
-        imported = self.state_manager.import_all_drafts()
+        imported = self.state_manager.import_all_drafts(state)
         if imported:
             print(f"Imported {len(imported)} draft files into state.")
 
-        drafts = self.state_manager.get_drafts()
+        drafts = [i for i in state.issues.values() if i.status == IssueStatus.draft]
 
         if not drafts:
             return WorkflowResult(
@@ -140,49 +251,74 @@ class IssueWorkflow:
                 message="No draft issues to triage.",
             )
 
-        print(f"\n=== Triaging {len(drafts)} draft issues ===\n")
+        now = datetime.now()
+        triaged_count = 0
 
-        task_context = json.dumps(
-            [d.model_dump(mode="json") for d in drafts],
-            indent=2,
-            default=str,
-        )
+        # Drafts whose raw title/description match a live triaged issue reuse
+        # its triage output; identical drafts go to the agent once
+        known = {}
+        for issue in state.issues.values():
+            if issue.status in _REUSABLE_TRIAGE_STATUSES:
+                known.setdefault(_raw_content_key(issue), issue)
+        reused: list[tuple[str, dict[str, Any]]] = []
+        to_send: list[Issue] = []
+        duplicates: dict[tuple[str, str], list[str]] = {}
+        for draft in drafts:
+            key = _raw_content_key(draft)
+            if key in known:
+                reused.append((draft.id, _triage_output_of(known[key])))
+            elif key in duplicates:
+                duplicates[key].append(draft.id)
+            else:
+                duplicates[key] = []
+                to_send.append(draft)
+
+        result = None
+        if to_send:
+            print(f"\n=== Triaging {len(to_send)} draft issues ===\n")
+
+            task_context = _task_json(to_send)
+
+            result = self._run_agent("issue-triage", task_context)
 
-        result = self._run_agent("issue-triage", task_context)
+            if result is None:
+                return WorkflowResult(
+                    success=False,
+                    message="Triage agent failed.",
+                )
 
-        if result is None:
-            return WorkflowResult(
-                success=False,
-                message="Triage agent failed.",
-            )
+            self._refresh(state)
 
-        # Apply agent output to state
-        state = self.state_manager.load()
-        triaged_count = 0
+        # Results are applied by id, and only to issues still in draft, so
+        # anything changed on disk during the agent run is left alone
+        def apply(issue_id: str, issue_data: dict[str, Any]) -> bool:
+            issue = state.issues.get(issue_id)
+            if issue is None or issue.status != IssueStatus.draft:
+                return False
+            _apply_triage(issue, issue_data, now)
+            return True
+
+        for issue_id, issue_data in reused:
+            triaged_count += apply(issue_id, issue_data)
+        if reused:
+            print(f"Reused triage results for {len(reused)} previously seen issues.")
 
+        # Apply agent output to state
         if isinstance(result, list):
             for issue_data in result:
                 issue_id = issue_data.get("id")
-                if issue_id and issue_id in state.issues:
-                    issue = state.issues[issue_id]
-                    # Overwrite with sanitized content (preserve raw in context)
-                    if "title" in issue_data and issue_data["title"] != issue.title:
-                        issue.context["raw_title"] = issue.title
-                        issue.title = issue_data["title"]
-                    if "description" in issue_data and issue_data["description"] != issue.description:
-                        issue.context["raw_description"] = issue.description
-                        issue.description = issue_data["description"]
-                    if "affected_files" in issue_data:
-                        issue.affected_files = issue_data["affected_files"]
-                    if "tags" in issue_data:
-                        issue.tags = issue_data["tags"]
-                    if "severity" in issue_data:
-                        issue.severity = IssueSeverity(issue_data["severity"])
-                    issue.status = IssueStatus.triaged
-                    issue.updated = datetime.now()
-                    triaged_count += 1
-
-        state.last_triage_run = datetime.now()
+                if issue_id:
+                    triaged_count += apply(issue_id, issue_data)
+
+        # Copy each triaged representative's result to its duplicates
+        for draft in to_send:
+            source = state.issues.get(draft.id)
+            if source is None or source.status != IssueStatus.triaged:
+                continue
+            for dup_id in duplicates[_raw_content_key(draft)]:
+                triaged_count += apply(dup_id, _triage_output_of(source))
+
+        state.last_triage_run = now
         self.state_manager.save(state)
 
         return WorkflowResult(
@@ -191,9 +327,11 @@ class IssueWorkflow:
             data={"count": triaged_count},
         )
 
-    def run_clustering(self) -> WorkflowResult:
+    def run_clustering(self, state: IssueState | None = None) -> WorkflowResult:
         """Run clustering agent on triaged issues."""
-        triaged = self.state_manager.get_issues_by_status(IssueStatus.triaged)
+        if state is None:
+            state = self.state_manager.load()
+        triaged = [i for i in state.issues.values() if i.status == IssueStatus.triaged]
 
         if not triaged:
             return WorkflowResult(
@@ -203,11 +341,7 @@ class IssueWorkflow:
 
         print(f"\n=== Clustering {len(triaged)} triaged issues ===\n")
 
-        task_context = json.dumps(
-            [i.model_dump(mode="json") for i in triaged],
-            indent=2,
-            default=str,
-        )
+        task_context = _task_json(triaged)
 
         result = self._run_agent("issue-clustering", task_context)
 
@@ -218,7 +352,8 @@ class IssueWorkflow:
             )
 
         # Apply agent output to state
-        state = self.state_manager.load()
+        self._refresh(state)
+        now = datetime.now()
         cluster_count = 0
 
         if isinstance(result, dict):
@@ -247,16 +382,16 @@ class IssueWorkflow:
             # Update issues with cluster assignments
             for issue_data in result.get("issues", []):
                 issue_id = issue_data.get("id")
-                if issue_id and issue_id in state.issues:
-                    issue = state.issues[issue_id]
+                issue = state.issues.get(issue_id) if issue_id else None
+                if issue is not None and issue.status == IssueStatus.triaged:
                     if "cluster_id" in issue_data:
                         issue.cluster_id = issue_data["cluster_id"]
                     if "similarity_score" in issue_data:
                         issue.similarity_score = issue_data["similarity_score"]
                     issue.status = IssueStatus.clustered
-                    issue.updated = datetime.now()
+                    issue.updated = now
 
-        state.last_cluster_run = datetime.now()
+        state.last_cluster_run = now
         self.state_manager.save(state)
 
         return WorkflowResult(
@@ -264,9 +399,10 @@ class IssueWorkflow:
             message=f"Created {cluster_count} clusters from {len(triaged)} issues.",
         )
 
-    def run_prioritization(self) -> WorkflowResult:
+    def run_prioritization(self, state: IssueState | None = None) -> WorkflowResult:
         """Run prioritization agent, then human gate."""
-        state = self.state_manager.load()
+        if state is None:
+            state = self.state_manager.load()
         to_prioritize = [
             i for i in state.issues.values()
             if i.status in (IssueStatus.triaged, IssueStatus.clustered)
@@ -280,13 +416,8 @@ class IssueWorkflow:
 
         print(f"\n=== Prioritizing {len(to_prioritize)} issues ===\n")
 
-        task_context = json.dumps(
-            {
-                "issues": [i.model_dump(mode="json") for i in to_prioritize],
-                "clusters": [c.model_dump(mode="json") for c in state.clusters.values()],
-            },
-            indent=2,
-            default=str,
+        task_context = _task_json(
+            {"issues": to_prioritize, "clusters": list(state.clusters.values())}
         )
 
         result = self._run_agent("issue-prioritization", task_context)
@@ -297,43 +428,26 @@ class IssueWorkflow:
                 message="Prioritization agent failed.",
             )
 
-        # Apply agent output to state
-        if isinstance(result, dict):
-            # Update issues with priority scores
-            for issue_data in result.get("issues", []):
-                issue_id = issue_data.get("id")
-                if issue_id and issue_id in state.issues:
-                    issue = state.issues[issue_id]
-                    if "severity" in issue_data:
-                        issue.severity = IssueSeverity(issue_data["severity"])
-                    if "fix_complexity" in issue_data:
-                        issue.fix_complexity = issue_data["fix_complexity"]
-                    if "priority_score" in issue_data:
-                        issue.priority_score = issue_data["priority_score"]
-                    issue.status = IssueStatus.prioritized
-                    issue.updated = datetime.now()
-
-            # Update clusters with aggregate priority (accept both id/cluster_id)
-            for cluster_data in result.get("clusters", []):
-                cluster_id = cluster_data.get("id") or cluster_data.get("cluster_id")
-                if cluster_id and cluster_id in state.clusters:
-                    cluster = state.clusters[cluster_id]
-                    if "aggregate_priority" in cluster_data:
-                        cluster.aggregate_priority = cluster_data["aggregate_priority"]
-                    if "aggregate_severity" in cluster_data:
-                        cluster.aggregate_severity = IssueSeverity(
-                            cluster_data["aggregate_severity"]
-                        )
+        # Apply agent output to the current on-disk state
+        now = datetime.now()
+        self._refresh(state)
+        self._apply_prioritization(state, result, now)
 
         # Human gate: approve prioritization
-        approved = self._gate_prioritization()
+        approved = self._gate_prioritization(state)
         if not approved:
             return WorkflowResult(
                 success=False,
                 message="Prioritization rejected by user.",
             )
 
-        state.last_prioritize_run = datetime.now()
+        # The gate can wait on a human for a long time; reapply on top of
+        # whatever was saved meanwhile
+        if not self.auto_approve:
+            self._refresh(state)
+            self._apply_prioritization(state, result, now)
+
+        state.last_prioritize_run = now
         self.state_manager.save(state)
 
         return WorkflowResult(
@@ -341,9 +455,46 @@ class IssueWorkflow:
             message="Prioritization approved.",
         )
 
-    def run_resolution(self, cluster_id: str) -> WorkflowResult:
+    def _apply_prioritization(
+        self, state: IssueState, result: dict | list, now: datetime
+    ) -> None:
+        """Apply prioritization agent output to issues still awaiting it."""
+        if not isinstance(result, dict):
+            return
+        # Update issues with priority scores
+        for issue_data in result.get("issues", []):
+            issue_id = issue_data.get("id")
+            issue = state.issues.get(issue_id) if issue_id else None
+            if issue is not None and issue.status in (
+                IssueStatus.triaged, IssueStatus.clustered
+            ):
+                if "severity" in issue_data:
+                    issue.severity = IssueSeverity(issue_data["severity"])
+                if "fix_complexity" in issue_data:
+                    issue.fix_complexity = issue_data["fix_complexity"]
+                if "priority_score" in issue_data:
+                    issue.priority_score = issue_data["priority_score"]
+                issue.status = IssueStatus.prioritized
+                issue.updated = now
+
+        # Update clusters with aggregate priority (accept both id/cluster_id)
+        for cluster_data in result.get("clusters", []):
+            cluster_id = cluster_data.get("id") or cluster_data.get("cluster_id")
+            if cluster_id and cluster_id in state.clusters:
+                cluster = state.clusters[cluster_id]
+                if "aggregate_priority" in cluster_data:
+                    cluster.aggregate_priority = cluster_data["aggregate_priority"]
+                if "aggregate_severity" in cluster_data:
+                    cluster.aggregate_severity = IssueSeverity(
+                        cluster_data["aggregate_severity"]
+                    )
+
+    def run_resolution(
+        self, cluster_id: str, state: IssueState | None = None
+    ) -> WorkflowResult:
         """Run resolution agent on an approved cluster."""
-        state = self.state_manager.load()
+        if state is None:
+            state = self.state_manager.load()
 
         if cluster_id not in state.clusters:
             return WorkflowResult(
@@ -364,14 +515,7 @@ class IssueWorkflow:
         print(f"Issues: {len(issues)}")
         print(f"Affected files: {', '.join(cluster.affected_files[:5])}")
 
-        task_context = json.dumps(
-            {
-                "cluster": cluster.model_dump(mode="json"),
-                "issues": [i.model_dump(mode="json") for i in issues],
-            },
-            indent=2,
-            default=str,
-        )
+        task_context = _task_json({"cluster": cluster, "issues": issues})
 
         result = self._run_agent("issue-resolution", task_context)
 
@@ -393,14 +537,35 @@ class IssueWorkflow:
                     success=False,
                     message="Resolution plan rejected.",
                 )
-            result = self._run_agent("issue-resolution", task_context, approved=True)
+            # Continue the planning session so the agent implements the plan
+            # it already wrote instead of re-analysing the cluster from
+            # scratch; without a session ID, send the plan back with the task
+            plan_session = self._last_session_id
+            if plan_session:
+                result = self._run_agent(
+                    "issue-resolution", resume_session=plan_session
+                )
+            else:
+                result = self._run_agent(
+                    "issue-resolution",
+                    f"{task_context}\n\n## Prior Plan (approved)\n\n{_task_json(result)}",
+                    approved=True,
+                )
             if result is None:
                 return WorkflowResult(
                     success=False,
                     message="Resolution agent failed after approval.",
                 )
 
-        # Apply resolution output to state
+        # Apply resolution output to the current on-disk state
+        self._refresh(state)
+        cluster = state.clusters.get(cluster_id)
+        if cluster is None:
+            return WorkflowResult(
+                success=False,
+                message=f"Cluster {cluster_id} was removed during resolution.",
+            )
+        issues = [state.issues[iid] for iid in cluster.issue_ids if iid in state.issues]
         if isinstance(result, dict):
             if "commit" in result:
                 for issue in issues:
@@ -420,7 +585,9 @@ class IssueWorkflow:
             message=f"Resolved cluster {cluster_id}.",
         )
 
-    def _fast_track_resolve(self, issue: Issue) -> WorkflowResult:
+    def _fast_track_resolve(
+        self, issue: Issue, state: IssueState | None = None
+    ) -> WorkflowResult:
         """Resolve critical issue immediately, skipping cluster/prioritize.
 
         Creates a singleton cluster and resolves in one state transaction.
@@ -438,38 +605,40 @@ class IssueWorkflow:
             status="approved",  # Auto-approve critical issues
         )
 
-        # Single state load - will be saved in run_resolution()
-        state = self.state_manager.load()
+        # Persist the fast-track decision before the long agent run
+        if state is None:
+            state = self.state_manager.load()
         state.clusters[cluster.id] = cluster
         issue.cluster_id = cluster.id
         issue.status = IssueStatus.prioritized
         state.issues[issue.id] = issue  # Update issue in state
         self.state_manager.save(state)
 
-        # Resolve - run_resolution() handles its own state management
-        return self.run_resolution(cluster.id)
+        # Resolve on the same in-memory state; run_resolution() saves it
+        return self.run_resolution(cluster.id, state)
 
     # ========================================================================
     # Human Gates
     # ========================================================================
 
-    def _gate_prioritization(self) -> bool:
-        """Human gate: approve priority ranking."""
+    def _gate_prioritization(self, state: IssueState) -> bool:
+        """Human gate: approve priority ranking.
+
+        Shows the in-memory state, which includes the agent's new scores
+        before they are saved.
+        """
         if self.auto_approve:
             print("\n[--yes] Auto-approving prioritization")
             return True
 
-        state = self.state_manager.load()
-
         print("\n" + "=" * 60)
         print("HUMAN GATE: Priority Review")
         print("=" * 60)
 
-        clusters = sorted(
-            state.clusters.values(),
-            key=lambda c: c.aggregate_priority,
-            reverse=True,
-        )[:10]
+        # Only the top 10 are shown; nlargest avoids sorting everything
+        clusters = heapq.nlargest(
+            10, state.clusters.values(), key=lambda c: c.aggregate_priority
+        )
 
         if clusters:
             print("\nTop clusters by priority:\n")
@@ -482,11 +651,9 @@ class IssueWorkflow:
                 print(f"   Issues: {len(cluster.issue_ids)}")
                 print()
         else:
-            issues = sorted(
-                state.issues.values(),
-                key=lambda i: i.priority_score or 0,
-                reverse=True,
-            )[:10]
+            issues = heapq.nlargest(
+                10, state.issues.values(), key=lambda i: i.priority_score or 0
+            )
 
             print("\nTop issues by priority:\n")
             for i, issue in enumerate(issues, 1):
@@ -559,40 +726,47 @@ class IssueWorkflow:
         print("ISSUE PROCESSING PIPELINE")
         print("=" * 60)
 
-        result = self.run_triage()
+        # One state object is threaded through every stage; each stage
+        # saves it when done, and reloads it only before applying an agent
+        # result, so edits made from another shell during a run survive
+        state = self.state_manager.load()
+
+        result = self.run_triage(state)
         if not result.success:
             return result
         print(f"\n[1/4] Triage: {result.message}")
 
         # Fast-track critical issues (skip clustering/prioritization)
-        state = self.state_manager.load()
-        critical_issues = [
-            i for i in state.issues.values()
+        critical_ids = [
+            i.id for i in state.issues.values()
             if i.status == IssueStatus.triaged and i.severity == IssueSeverity.critical
         ]
-        if critical_issues:
-            print(f"\n=== Fast-tracking {len(critical_issues)} critical issues ===")
+        if critical_ids:
+            print(f"\n=== Fast-tracking {len(critical_ids)} critical issues ===")
             fast_track_failures = []
-            for issue in critical_issues:
-                ft_result = self._fast_track_resolve(issue)
+            for issue_id in critical_ids:
+                # Look up each time: every fast-track reloads the state
+                issue = state.issues.get(issue_id)
+                if issue is None or issue.status != IssueStatus.triaged:
+                    continue
+                ft_result = self._fast_track_resolve(issue, state)
                 if not ft_result.success:
-                    fast_track_failures.append((issue.id, ft_result.message))
+                    fast_track_failures.append((issue_id, ft_result.message))
             if fast_track_failures:
                 print(f"\nWarning: {len(fast_track_failures)} fast-track resolutions failed:")
                 for issue_id, msg in fast_track_failures:
                     print(f"  - {issue_id}: {msg}")
 
-        result = self.run_clustering()
+        result = self.run_clustering(state)
         if not result.success:
             return result
         print(f"\n[2/4] Clustering: {result.message}")
 
-        result = self.run_prioritization()
+        result = self.run_prioritization(state)
         if not result.success:
             return result
         print(f"\n[3/4] Prioritization: {result.message}")
 
-        state = self.state_manager.load()
         approved_clusters = [
             c for c in state.clusters.values()
             if c.status == "approved"
@@ -607,7 +781,7 @@ class IssueWorkflow:
             )
 
         for cluster in approved_clusters:
-            result = self.run_resolution(cluster.id)
+            result = self.run_resolution(cluster.id, state)
             print(f"\n[4/4] Resolution ({cluster.id}): {result.message}")
 
         return WorkflowResult(
@@ -0,0 +1,169 @@
+"""Tests for the Claude Code CLI runner, using a fake `claude` on PATH."""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from issue_workflow.runner import ClaudeCodeRunner, _parse_json_from_markdown
+
+# Fake CLI: records its argv and pid, then behaves per FAKE_CLAUDE_MODE
+FAKE_CLAUDE = """\
+import json, os, sys, time
+
+out = os.environ["FAKE_CLAUDE_DIR"]
+with open(os.path.join(out, "argv.json"), "w") as f:
+    json.dump(sys.argv[1:], f)
+with open(os.path.join(out, "pid"), "w") as f:
+    f.write(str(os.getpid()))
+
+mode = os.environ.get("FAKE_CLAUDE_MODE", "ok")
+if mode == "fail":
+    print("boom: auth expired", file=sys.stderr)
+    sys.exit(3)
+if mode == "hang":
+    time.sleep(60)
+
+print(json.dumps({"type": "system", "subtype": "init"}))
+print("not json at all")
+print(json.dumps({"type": "assistant", "message": {"content": "thinking"}}))
+print(json.dumps({
+    "type": "result",
+    "result": os.environ.get("FAKE_CLAUDE_RESULT", ""),
+    "is_error": mode == "error",
+    "usage": {"input_tokens": 10, "output_tokens": 5},
+    "session_id": "sess-123",
+}))
+"""
+
+
+@pytest.fixture
+def fake_claude(tmp_path: Path, monkeypatch) -> Path:
+    """Put a scripted `claude` first on PATH; returns its output dir."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "claude"
+    script.write_text(f"#!{sys.executable}\n{FAKE_CLAUDE}")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_CLAUDE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def runner(tmp_path: Path) -> ClaudeCodeRunner:
+    """Runner rooted in a temp dir."""
+    return ClaudeCodeRunner(cwd=tmp_path, max_turns=3)
+
+
+class TestRun:
+    """Test ClaudeCodeRunner.run against the fake CLI."""
+
+    def test_result_event_parsed(self, fake_claude, runner, monkeypatch):
+        """The result event's JSON output, usage and session are returned."""
+        monkeypatch.setenv("FAKE_CLAUDE_RESULT", '{"action": "done", "notes": "ok"}')
+
+        result = runner.run(
+            "do it",
+            allowed_tools=["Read", "Grep"],
+            system_prompt="Be brief.",
+            resume_session="prev-1",
+        )
+
+        assert result.success
+        assert result.error is None
+        assert result.parsed_data == {"action": "done", "notes": "ok"}
+        assert result.usage == {"input_tokens": 10, "output_tokens": 5}
+        assert result.session_id == "sess-123"
+        argv = json.loads((fake_claude / "argv.json").read_text())
+        assert argv[:2] == ["-p", "do it"]
+        assert argv[argv.index("--output-format") + 1] == "stream-json"
+        assert argv[argv.index("--max-turns") + 1] == "3"
+        assert argv[argv.index("--allowedTools") + 1] == "Read,Grep"
+        assert argv[argv.index("--append-system-prompt") + 1] == "Be brief."
+        assert argv[argv.index("--resume") + 1] == "prev-1"
+
+    def test_json_in_markdown_fallback(self, fake_claude, runner, monkeypatch):
+        """Output wrapped in prose and a fenced block is still parsed."""
+        monkeypatch.setenv(
+            "FAKE_CLAUDE_RESULT",
+            'Here you go:\n```json\n[{"id": "a1", "severity": "low"}]\n```\nDone.',
+        )
+
+        result = runner.run("triage")
+
+        assert result.success
+        assert result.parsed_data == [{"id": "a1", "severity": "low"}]
+
+    def test_plain_text_output_not_parsed(self, fake_claude, runner, monkeypatch):
+        """Non-JSON output succeeds with parsed_data left unset."""
+        monkeypatch.setenv("FAKE_CLAUDE_RESULT", "All fixed.")
+
+        result = runner.run("fix")
+
+        assert result.success
+        assert result.output == "All fixed."
+        assert result.parsed_data is None
+
+    def test_nonzero_exit_captures_stderr(self, fake_claude, runner, monkeypatch):
+        """A failing CLI reports its stderr as the error."""
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "fail")
+
+        result = runner.run("do it")
+
+        assert not result.success
+        assert "boom: auth expired" in result.error
+
+    def test_agent_error_reported(self, fake_claude, runner, monkeypatch):
+        """is_error in the result event fails the run with its message."""
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "error")
+        monkeypatch.setenv("FAKE_CLAUDE_RESULT", "max turns reached")
+
+        result = runner.run("do it")
+
+        assert not result.success
+        assert result.error == "max turns reached"
+
+    def test_timeout_kills_process(self, fake_claude, runner, monkeypatch):
+        """A hung CLI is killed and reaped once the timeout passes."""
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "hang")
+
+        threads_before = threading.active_count()
+
+        result = runner.run("do it", timeout=1)
+
+        assert not result.success
+        assert result.error == "Timeout after 1 seconds"
+        assert threading.active_count() == threads_before  # Reader was joined
+        pid = int((fake_claude / "pid").read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    def test_cli_missing(self, runner, monkeypatch, tmp_path):
+        """Without a claude binary on PATH, an install hint is returned."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        result = runner.run("do it")
+
+        assert not result.success
+        assert "not found" in result.error
+
+
+class TestParseJsonFromMarkdown:
+    """Test fenced-block JSON extraction."""
+
+    def test_skips_invalid_block(self):
+        """The first block that parses wins."""
+        text = "```json\n{broken\n```\n\n```json\n{\"a\": 1}\n```"
+        assert _parse_json_from_markdown(text) == {"a": 1}
+
+    def test_untagged_block(self):
+        """Blocks without a language tag are tried too."""
+        assert _parse_json_from_markdown("```\n[1, 2]\n```") == [1, 2]
+
+    def test_no_block(self):
+        """Text without a code block yields None."""
+        assert _parse_json_from_markdown("no json here") is None
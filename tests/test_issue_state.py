@@ -0,0 +1,126 @@
+"""Tests for issue workflow state management."""
+
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from issue_workflow.state_manager import IssueStateManager
+from shared import IssueReporter
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> IssueStateManager:
+    """State manager rooted in a temporary runtime directory."""
+    return IssueStateManager(
+        state_path=tmp_path / "issue-state.json",
+        drafts_dir=tmp_path / "issue-drafts",
+        issues_dir=tmp_path / "issues",
+    )
+
+
+class TestSave:
+    """Test atomic state writes."""
+
+    @pytest.mark.skipif(not hasattr(os, "O_DIRECTORY"), reason="no directory fsync")
+    def test_fsyncs_file_then_directory(self, manager, monkeypatch):
+        """Both the temp file and, after the rename, its directory are synced."""
+        synced = []
+        real_fsync = os.fsync
+
+        def fsync(fd):
+            synced.append(stat.S_ISDIR(os.fstat(fd).st_mode))
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+
+        manager.save(manager.load())
+
+        assert synced == [False, True]
+        assert not manager.state_path.with_suffix(".json.tmp").exists()
+
+
+class TestImportAllDrafts:
+    """Test batch draft import."""
+
+    def test_imports_drafts_and_deletes_files(self, manager):
+        """Valid drafts land in state and their files are removed."""
+        reporter = IssueReporter(drafts_dir=manager.drafts_dir)
+        reporter.save_draft_issue("First", "Desc 1")
+        reporter.save_draft_issue("Second", "Desc 2")
+
+        imported = manager.import_all_drafts()
+
+        assert sorted(i.title for i in imported) == ["First", "Second"]
+        assert len(manager.load().issues) == 2
+        assert list(manager.drafts_dir.glob("draft_*.json")) == []
+
+    def test_bad_draft_is_skipped_not_fatal(self, manager, capsys):
+        """An unreadable draft is left in place; the rest are still saved."""
+        reporter = IssueReporter(drafts_dir=manager.drafts_dir)
+        reporter.save_draft_issue("Good", "Desc")
+        bad_json = manager.drafts_dir / "draft_20240101_000000_badjson.json"
+        bad_json.write_text("{not json")
+        missing_field = manager.drafts_dir / "draft_20240101_000000_nodesc.json"
+        missing_field.write_text(json.dumps({"title": "No description"}))
+
+        imported = manager.import_all_drafts()
+
+        assert [i.title for i in imported] == ["Good"]
+        assert [i.title for i in manager.load().issues.values()] == ["Good"]
+        assert bad_json.exists()
+        assert missing_field.exists()
+        assert "Skipping unreadable draft" in capsys.readouterr().err
+
+    def test_no_drafts_leaves_state_untouched(self, manager):
+        """With no draft files, nothing is imported and no state is written."""
+        assert manager.import_all_drafts() == []
+        assert not manager.state_path.exists()
+
+
+class TestResolveIssuesBulk:
+    """Test batched resolution."""
+
+    def test_changelog_entries_newest_first(self, manager):
+        """A bulk resolve lists its entries as sequential resolves would."""
+        a = manager.save_draft("A", "Desc")
+        b = manager.save_draft("B", "Desc")
+        c = manager.save_draft("C", "Desc")
+
+        manager.resolve_issue(a.id, "fixed a", "abc1")
+        manager.resolve_issues_bulk([(b.id, "fixed b", "abc2"), (c.id, "fixed c", "abc2")])
+
+        changelog = (manager.issues_dir / "CHANGELOG.md").read_text()
+        lines = [line for line in changelog.splitlines() if line.startswith("- ")]
+        assert lines == [
+            f"- **{c.id}**: fixed c",
+            f"- **{b.id}**: fixed b",
+            f"- **{a.id}**: fixed a",
+        ]
+        assert changelog.count("\n## ") == 1  # One header for today
+
+    def test_marks_issues_resolved_in_one_save(self, manager):
+        """All issues are resolved with their notes and commit."""
+        a = manager.save_draft("A", "Desc")
+        b = manager.save_draft("B", "Desc")
+
+        manager.resolve_issues_bulk([(a.id, "fixed", "abc"), (b.id, "fixed", "abc")])
+
+        issues = manager.load().issues
+        assert {issues[a.id].status, issues[b.id].status} == {"resolved"}
+        assert issues[b.id].resolved_by == "abc"
+        assert issues[b.id].resolution_notes == "fixed"
+
+    def test_unknown_id_raises_without_partial_save(self, manager):
+        """An unknown id fails before any issue or the changelog changes."""
+        a = manager.save_draft("A", "Desc")
+        before = manager.state_path.read_bytes()
+
+        with pytest.raises(ValueError, match="not found"):
+            manager.resolve_issues_bulk([(a.id, "fixed", "abc"), ("missing", "x", "y")])
+
+        assert manager.state_path.read_bytes() == before
+        assert manager.load().issues[a.id].status == "draft"
+        assert not (manager.issues_dir / "CHANGELOG.md").exists()
@@ -0,0 +1,309 @@
+"""Tests for issue workflow orchestration with a fake agent runner."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from issue_workflow.runner import RunResult
+from issue_workflow.state_manager import IssueStateManager
+from issue_workflow.workflow import _APPROVAL_MESSAGE, IssueWorkflow
+from shared import IssueCluster, IssueStatus
+
+
+class FakeRunner:
+    """Stands in for ClaudeCodeRunner; records calls, returns canned data.
+
+    A None response is reported as a failed run.
+    """
+
+    def __init__(self, respond, session_id: str | None = None):
+        self.respond = respond
+        self.session_id = session_id
+        self.prompts: list[str] = []
+        self.agents: list[str] = []
+        self.resumed: list[str | None] = []
+
+    def run(self, prompt, allowed_tools=None, system_prompt=None, resume_session=None, **kwargs):
+        self.prompts.append(prompt)
+        # Stub agent bodies read "Stub <name>."
+        self.agents.append(system_prompt.removeprefix("Stub ").removesuffix("."))
+        self.resumed.append(resume_session)
+        data = self.respond(prompt)
+        if data is None:
+            return RunResult(success=False, output="", error="agent crashed")
+        return RunResult(
+            success=True, output=json.dumps(data), parsed_data=data, session_id=self.session_id
+        )
+
+
+def task_of(prompt: str):
+    """The JSON task payload the workflow sent in a prompt."""
+    return json.loads(prompt.split("## Current Task\n\n", 1)[1].split("\n\n")[0])
+
+
+@pytest.fixture
+def workflow(tmp_path: Path, monkeypatch) -> IssueWorkflow:
+    """Workflow rooted in a temp dir with stub agent definitions."""
+    monkeypatch.chdir(tmp_path)  # Default runtime paths are cwd-relative
+    agents = tmp_path / ".claude" / "agents"
+    agents.mkdir(parents=True)
+    for name in ("issue-triage", "issue-clustering", "issue-prioritization", "issue-resolution"):
+        (agents / f"{name}.md").write_text(f"---\nname: {name}\ntools: Read\n---\n\nStub {name}.\n")
+
+    wf = IssueWorkflow(cwd=tmp_path, auto_approve=True)
+    wf.state_manager = IssueStateManager(
+        state_path=tmp_path / "issue-state.json",
+        drafts_dir=tmp_path / "issue-drafts",
+        issues_dir=tmp_path / "issues",
+    )
+    return wf
+
+
+PLAN = {"action": "needs_approval", "plan": "Rewrite the parser", "confidence": 0.4}
+DONE = {"action": "implemented", "notes": "fixed", "commit": "abc"}
+
+
+def plan_then(*responses):
+    """Resolution agent that asks for approval, then gives `responses`."""
+    queue = [PLAN, *responses]
+    return lambda prompt: queue.pop(0)
+
+
+@pytest.fixture
+def approved_cluster(workflow) -> str:
+    """An approved cluster with one issue; returns the issue id."""
+    sm = workflow.state_manager
+    issue = sm.save_draft("A", "Desc")
+    state = sm.load()
+    state.clusters["c1"] = IssueCluster(id="c1", theme="T", issue_ids=[issue.id], status="approved")
+    sm.save(state)
+    return issue.id
+
+
+class TestRunResolution:
+    """Test applying resolution agent output."""
+
+    def test_cluster_resolved_with_notes(self, workflow):
+        """All cluster issues take the agent's notes and commit."""
+        sm = workflow.state_manager
+        a = sm.save_draft("A", "Desc")
+        b = sm.save_draft("B", "Desc")
+        state = sm.load()
+        state.clusters["c1"] = IssueCluster(id="c1", theme="T", issue_ids=[a.id, b.id], status="approved")
+        sm.save(state)
+        workflow._runner = FakeRunner(lambda p: {"action": "implemented", "notes": "fixed", "commit": "abc"})
+
+        result = workflow.run_resolution("c1")
+
+        assert result.success
+        state = sm.load()
+        assert state.clusters["c1"].status == "resolved"
+        for issue_id in (a.id, b.id):
+            issue = state.issues[issue_id]
+            assert issue.status == IssueStatus.resolved
+            assert issue.resolution_notes == "fixed"
+            assert issue.resolved_by == "abc"
+        assert not (sm.issues_dir / "CHANGELOG.md").exists()
+
+    def test_approved_plan_resumes_planning_session(self, workflow, approved_cluster):
+        """With a session ID, only the approval message is sent on resume."""
+        runner = FakeRunner(plan_then(DONE), session_id="sess-plan")
+        workflow._runner = runner
+
+        result = workflow.run_resolution("c1")
+
+        assert result.success
+        assert runner.resumed == [None, "sess-plan"]
+        assert runner.prompts[1] == _APPROVAL_MESSAGE
+        assert workflow._last_session_id == "sess-plan"
+        assert workflow.state_manager.load().issues[approved_cluster].resolved_by == "abc"
+
+    def test_approved_plan_sent_back_without_session(self, workflow, approved_cluster):
+        """Without a session ID, the task is resent with the plan embedded."""
+        runner = FakeRunner(plan_then(DONE))
+        workflow._runner = runner
+
+        result = workflow.run_resolution("c1")
+
+        assert result.success
+        assert runner.resumed == [None, None]
+        assert workflow._last_session_id is None
+        retry = runner.prompts[1]
+        assert retry.startswith(runner.prompts[0])
+        plan_json = retry.split("## Prior Plan (approved)\n\n", 1)[1].split("\n\n")[0]
+        assert json.loads(plan_json) == PLAN
+        assert retry.endswith(_APPROVAL_MESSAGE)
+
+    def test_rejected_plan_leaves_cluster_unresolved(self, workflow, approved_cluster, monkeypatch):
+        """Declining the plan stops before any implementation call."""
+        runner = FakeRunner(plan_then(), session_id="sess-plan")
+        workflow._runner = runner
+        workflow.auto_approve = False
+        monkeypatch.setattr("builtins.input", lambda prompt: "n")
+
+        result = workflow.run_resolution("c1")
+
+        assert not result.success
+        assert result.message == "Resolution plan rejected."
+        assert len(runner.prompts) == 1
+        state = workflow.state_manager.load()
+        assert state.clusters["c1"].status == "approved"
+        assert state.issues[approved_cluster].status == IssueStatus.draft
+
+    def test_failure_after_approval(self, workflow, approved_cluster):
+        """A failed implementation run leaves the cluster unresolved."""
+        runner = FakeRunner(plan_then(None), session_id="sess-plan")
+        workflow._runner = runner
+
+        result = workflow.run_resolution("c1")
+
+        assert not result.success
+        assert result.message == "Resolution agent failed after approval."
+        assert workflow.state_manager.load().clusters["c1"].status == "approved"
+
+
+def triage_echo(prompt: str) -> list[dict]:
+    """Triage agent that tags each issue it is sent."""
+    return [
+        {"id": d["id"], "title": d["title"].strip(), "tags": ["seen"], "severity": "low"}
+        for d in task_of(prompt)
+    ]
+
+
+class TestRunTriage:
+    """Test triage dedup and reuse of earlier results."""
+
+    def test_identical_drafts_sent_once(self, workflow):
+        """Duplicate drafts share one agent result."""
+        sm = workflow.state_manager
+        a = sm.save_draft(" Crash ", "Same desc")
+        b = sm.save_draft(" Crash ", "Same desc")
+        c = sm.save_draft("Other", "Different")
+        runner = FakeRunner(triage_echo)
+        workflow._runner = runner
+
+        result = workflow.run_triage()
+
+        assert result.data["count"] == 3
+        assert len(runner.prompts) == 1
+        assert sorted(d["id"] for d in task_of(runner.prompts[0])) == sorted([a.id, c.id])
+        issues = sm.load().issues
+        for issue_id in (a.id, b.id, c.id):
+            assert issues[issue_id].status == IssueStatus.triaged
+            assert issues[issue_id].tags == ["seen"]
+        assert issues[b.id].title == "Crash"
+        assert issues[b.id].context["raw_title"] == " Crash "
+
+    def test_live_issue_result_reused(self, workflow):
+        """A draft matching an open triaged issue skips the agent."""
+        sm = workflow.state_manager
+        sm.save_draft(" Crash ", "Same desc")
+        runner = FakeRunner(triage_echo)
+        workflow._runner = runner
+        workflow.run_triage()
+        again = sm.save_draft(" Crash ", "Same desc")
+
+        workflow.run_triage()
+
+        assert len(runner.prompts) == 1
+        issue = sm.load().issues[again.id]
+        assert issue.status == IssueStatus.triaged
+        assert issue.title == "Crash"
+        assert issue.tags == ["seen"]
+
+    @pytest.mark.parametrize("closed", [IssueStatus.resolved, IssueStatus.wont_fix])
+    def test_closed_issue_result_not_reused(self, workflow, closed):
+        """A draft matching a closed issue is triaged afresh."""
+        sm = workflow.state_manager
+        old = sm.save_draft(" Crash ", "Same desc")
+        state = sm.load()
+        state.issues[old.id].status = closed
+        state.issues[old.id].tags = ["stale"]
+        sm.save(state)
+        again = sm.save_draft(" Crash ", "Same desc")
+        runner = FakeRunner(triage_echo)
+        workflow._runner = runner
+
+        workflow.run_triage()
+
+        assert len(runner.prompts) == 1
+        assert [d["id"] for d in task_of(runner.prompts[0])] == [again.id]
+        assert sm.load().issues[again.id].tags == ["seen"]
+
+
+class TestProcess:
+    """Test the full pipeline."""
+
+    def test_edits_during_agent_runs_survive(self, workflow):
+        """Changes saved from another shell mid-run are not overwritten."""
+        sm = workflow.state_manager
+        a = sm.save_draft("A", "Desc A")
+        b = sm.save_draft("B", "Desc B")
+
+        def respond(prompt):
+            agent = runner.agents[-1]
+            if agent == "issue-triage":
+                workflow.wontfix_issue(b.id)
+                return [{"id": d["id"], "severity": "low"} for d in task_of(prompt)]
+            if agent == "issue-clustering":
+                return {
+                    "clusters": [{"id": "c1", "theme": "T", "issue_ids": [a.id]}],
+                    "issues": [{"id": a.id, "cluster_id": "c1"}],
+                }
+            if agent == "issue-prioritization":
+                workflow.approve_cluster("c1")
+                return {
+                    "issues": [{"id": a.id, "priority_score": 5.0}],
+                    "clusters": [{"id": "c1", "aggregate_priority": 5.0}],
+                }
+            return {"action": "implemented", "notes": "fixed", "commit": "abc"}
+
+        runner = FakeRunner(respond)
+        workflow._runner = runner
+
+        result = workflow.process()
+
+        assert result.message == "Pipeline complete."
+        assert runner.agents == [
+            "issue-triage", "issue-clustering", "issue-prioritization", "issue-resolution"
+        ]
+        state = sm.load()
+        assert state.issues[b.id].status == IssueStatus.wont_fix
+        assert state.issues[a.id].status == IssueStatus.resolved
+        assert state.issues[a.id].priority_score == 5.0
+        assert state.clusters["c1"].status == "resolved"
+        assert state.clusters["c1"].aggregate_priority == 5.0
+
+
+class TestRunPrioritization:
+    """Test applying prioritization output around the human gate."""
+
+    def test_edits_while_gate_waits_survive(self, workflow, monkeypatch):
+        """An edit saved while the user reads the ranking is kept."""
+        sm = workflow.state_manager
+        a = sm.save_draft("A", "Desc")
+        b = sm.save_draft("B", "Desc")
+        state = sm.load()
+        for issue in state.issues.values():
+            issue.status = IssueStatus.triaged
+        sm.save(state)
+        workflow.auto_approve = False
+        workflow._runner = FakeRunner(lambda p: {
+            "issues": [{"id": a.id, "priority_score": 7.0}, {"id": b.id, "priority_score": 3.0}],
+        })
+
+        def answer(prompt):
+            workflow.defer_issue(b.id)
+            return "y"
+
+        monkeypatch.setattr("builtins.input", answer)
+
+        result = workflow.run_prioritization()
+
+        assert result.success
+        issues = sm.load().issues
+        assert issues[a.id].status == IssueStatus.prioritized
+        assert issues[a.id].priority_score == 7.0
+        assert issues[b.id].status == IssueStatus.deferred
+        assert issues[b.id].priority_score is None
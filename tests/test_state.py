@@ -239,3 +239,29 @@ class TestStateManager:
 
         assert loaded is not None
         assert loaded.meta.last_updated > original_updated
+
+    def test_save_replaces_stale_tmp(self, tmp_path: Path):
+        """A tmp file left by an interrupted save does not block saving."""
+        state_path = tmp_path / "state.json"
+        state_path.with_suffix(".json.tmp").write_text("partial")
+        manager = StateManager(state_path=state_path)
+
+        manager.save(manager.create_initial_state(conversation_count=3))
+
+        assert not state_path.with_suffix(".json.tmp").exists()
+        loaded = manager.load()
+        assert loaded is not None
+        assert loaded.meta.conversation_count == 3
+
+    def test_missing_schema_version_is_migrated(self, tmp_path: Path):
+        """State without schema_version takes the migration path."""
+        state_path = tmp_path / "state.json"
+        now = datetime.now().isoformat()
+        state_path.write_text(json.dumps({"meta": {"created": now, "last_updated": now}}))
+
+        manager = StateManager(state_path=state_path)
+        loaded = manager.load()
+
+        assert loaded is not None
+        assert loaded.schema_version == manager.CURRENT_VERSION
+        assert isinstance(loaded.meta.created, datetime)
@@ -1,5 +1,6 @@
 """Tests for usage tracking and metrics collection."""
 
+import json
 import time
 from unittest.mock import MagicMock
 
@@ -161,3 +162,46 @@ class TestUsageReport:
         report = UsageReport()
         report.end_turn()  # Should not raise
         assert len(report.turn_timings) == 0
+
+    def test_total_latency_accumulates_across_turns(self):
+        """Running total matches the sum of recorded turn latencies."""
+        report = UsageReport()
+        for _ in range(3):
+            report.start_turn()
+            report.end_turn()
+
+        expected = sum(t.latency_seconds for t in report.turn_timings)
+        assert report.total_latency_seconds == pytest.approx(expected)
+
+    def test_total_latency_tracks_replaced_timings(self):
+        """Timings can only be replaced wholesale, which re-sums the total."""
+        report = UsageReport()
+        report.turn_timings = [TurnTiming(1, 1.0, ""), TurnTiming(2, 2.0, "")]
+        report.turn_timings = [TurnTiming(1, 5.0, ""), TurnTiming(2, 1.0, "")]
+
+        assert report.total_latency_seconds == 6.0
+        with pytest.raises(TypeError):
+            report.turn_timings[0] = TurnTiming(1, 9.0, "")  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            report.turn_timings[0].latency_seconds = 9.0  # type: ignore[misc]
+        assert report.total_latency_seconds == 6.0
+
+    def test_detailed_summary_json_is_single_line(self):
+        """JSON summary is one compact line matching detailed_summary."""
+        report = UsageReport(session_id="abc")
+        report.turn_timings = [TurnTiming(1, 1.5, "2024-01-01T12:00:00")]
+
+        line = report.detailed_summary_json()
+
+        assert "\n" not in line
+        assert json.loads(line)["timing"]["per_turn"][0]["turn"] == 1
+
+    def test_detailed_summary_json_matches_dict(self, monkeypatch):
+        """The direct serializer emits exactly what detailed_summary() holds."""
+        monkeypatch.setattr("chat_retro.usage.time.time", lambda: 1000.0)
+        report = UsageReport(session_id="abc", input_tokens=10, output_tokens=5)
+        report.session_start = 990.0
+        report.turn_timings = [TurnTiming(1, 1.5, "t1"), TurnTiming(2, 0.25, "t2")]
+        report.record_error(ValueError("bad"))
+
+        assert json.loads(report.detailed_summary_json()) == report.detailed_summary()
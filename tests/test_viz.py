@@ -1,9 +1,17 @@
 """Tests for visualization templates."""
 
 
+import time
+
 import pytest
-from datetime import datetime
-from chat_retro.viz_templates import TimelineViz, HeatmapViz, TopicClusterViz, LengthDistributionViz
+from datetime import datetime, timezone
+from chat_retro.viz_templates import (
+    ConversationColumns,
+    HeatmapViz,
+    LengthDistributionViz,
+    TimelineViz,
+    TopicClusterViz,
+)
 from chat_retro.artifacts import ArtifactGenerator
 
 
@@ -34,8 +42,8 @@ class TestTimelineViz:
         assert "timeline" in result
         assert len(result["timeline"]) == 2
         # Counts should be 2 for first day, 1 for second
-        counts = [item["count"] for item in result["timeline"]]
-        assert sorted(counts) == [1, 2]
+        counts = [count for _, count in result["timeline"]]
+        assert counts == [2, 1]
 
     def test_prepare_data_with_iso_strings(self):
         """Conversations with ISO date strings are processed."""
@@ -47,7 +55,10 @@ class TestTimelineViz:
         result = TimelineViz.prepare_data(conversations)
 
         assert len(result["timeline"]) == 2
-        counts = {item["date"]: item["count"] for item in result["timeline"]}
+        counts = {
+            datetime.fromtimestamp(ms / 1000, timezone.utc).date().isoformat(): count
+            for ms, count in result["timeline"]
+        }
         assert counts.get("2024-03-15") == 2
         assert counts.get("2024-03-16") == 1
 
@@ -60,8 +71,53 @@ class TestTimelineViz:
         ]
         result = TimelineViz.prepare_data(conversations)
 
-        dates = [item["date"] for item in result["timeline"]]
-        assert dates == sorted(dates)
+        stamps = [ms for ms, _ in result["timeline"]]
+        assert stamps == sorted(stamps)
+
+    def test_prepare_data_leaves_gap_days_out(self):
+        """Only active days are emitted; gaps are filled on the JS side."""
+        conversations = [
+            {"created_at": "2024-03-15T10:00:00"},
+            {"created_at": "2024-03-18T10:00:00"},
+        ]
+        result = TimelineViz.prepare_data(conversations)
+
+        assert [count for _, count in result["timeline"]] == [1, 1]
+        first_ms = result["timeline"][0][0]
+        assert datetime.fromtimestamp(first_ms / 1000, timezone.utc) == datetime(
+            2024, 3, 15, tzinfo=timezone.utc
+        )
+
+    def test_prepare_data_outlier_date_stays_small(self):
+        """An epoch-0 timestamp next to a recent one yields two rows, not decades."""
+        conversations = [
+            {"create_time": 0},
+            {"created_at": "2024-01-01T12:00:00"},
+        ]
+        result = TimelineViz.prepare_data(conversations)
+
+        assert len(result["timeline"]) == 2
+
+    def test_prepare_data_emits_utc_midnight(self, monkeypatch):
+        """Day stamps are UTC midnight, independent of the local timezone."""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            result = TimelineViz.prepare_data([{"created_at": "2024-03-15T10:00:00"}])
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert result["timeline"] == [[1710460800000, 1]]  # 2024-03-15T00:00Z
+
+    def test_get_js_code_uses_utc_days(self):
+        """The JS reads day stamps back in UTC, not the viewer's timezone."""
+        code = TimelineViz.get_js_code()
+        assert "d3.scaleUtc()" in code
+        assert "d3.utcDay.offset" in code
+        assert "d3.utcFormat" in code
+        for local in ("d3.scaleTime", "d3.timeDay", "d3.timeFormat"):
+            assert local not in code
 
     def test_prepare_data_skips_invalid(self):
         """Invalid timestamps are skipped."""
@@ -85,7 +141,7 @@ class TestTimelineViz:
         """JS code uses D3.js methods."""
         code = TimelineViz.get_js_code()
         assert "d3.select" in code
-        assert "d3.scaleTime" in code
+        assert "d3.scaleUtc" in code
         assert "d3.axisBottom" in code
 
     def test_get_js_code_references_data(self):
@@ -123,8 +179,7 @@ class TestTimelineIntegration:
 
         # Data is embedded
         assert '"timeline"' in html
-        assert '"date"' in html
-        assert '"count"' in html
+        assert str(data["timeline"][0][0]) in html
 
         # D3.js code is included
         assert "d3.select" in html
@@ -179,9 +234,9 @@ class TestHeatmapViz:
     """Tests for HeatmapViz visualization."""
 
     def test_prepare_data_empty(self):
-        """Empty conversation list returns empty heatmap."""
+        """Empty conversation list returns an all-zero 7x24 grid."""
         result = HeatmapViz.prepare_data([])
-        assert result == {"heatmap": []}
+        assert result == {"heatmap": [0] * 168}
 
     def test_prepare_data_aggregates_by_day_hour(self):
         """Conversations are aggregated by day and hour."""
@@ -199,14 +254,14 @@ class TestHeatmapViz:
         result = HeatmapViz.prepare_data(conversations)
 
         assert "heatmap" in result
-        assert len(result["heatmap"]) == 2
+        counts = result["heatmap"]
+        assert len(counts) == 168
+        assert sum(counts) == 3
 
-        # Check counts
-        counts = {(item["day"], item["hour"]): item["count"] for item in result["heatmap"]}
-        # Monday = day 1 (0=Sunday)
-        assert counts.get((1, 9)) == 2
+        # Monday = day 1 (0=Sunday), indexed by day * 24 + hour
+        assert counts[1 * 24 + 9] == 2
         # Tuesday = day 2
-        assert counts.get((2, 14)) == 1
+        assert counts[2 * 24 + 14] == 1
 
     def test_prepare_data_handles_sunday(self):
         """Sunday is correctly mapped to day 0."""
@@ -214,8 +269,8 @@ class TestHeatmapViz:
         conversations = [{"create_time": sunday}]
         result = HeatmapViz.prepare_data(conversations)
 
-        assert len(result["heatmap"]) == 1
-        assert result["heatmap"][0]["day"] == 0  # Sunday
+        assert result["heatmap"][0 * 24 + 10] == 1  # Sunday
+        assert sum(result["heatmap"]) == 1
 
     def test_prepare_data_skips_invalid(self):
         """Invalid timestamps are skipped."""
@@ -225,7 +280,12 @@ class TestHeatmapViz:
             {"other_field": "value"},
         ]
         result = HeatmapViz.prepare_data(conversations)
-        assert len(result["heatmap"]) == 1
+        assert sum(result["heatmap"]) == 1
+
+    def test_prepare_data_keeps_epoch_zero(self):
+        """A create_time of 0 is a valid epoch, not a missing value."""
+        result = HeatmapViz.prepare_data([{"create_time": 0}])
+        assert sum(result["heatmap"]) == 1
 
     def test_get_js_code_returns_string(self):
         """JS code is returned as string."""
@@ -287,7 +347,7 @@ class TestTopicClusterViz:
     def test_prepare_data_empty(self):
         """Empty patterns list returns empty nodes and links."""
         result = TopicClusterViz.prepare_data([])
-        assert result == {"nodes": [], "links": []}
+        assert result == {"nodes": [], "links": [], "types": []}
 
     def test_prepare_data_creates_nodes(self):
         """Patterns are converted to nodes with correct structure."""
@@ -300,11 +360,11 @@ class TestTopicClusterViz:
 
         assert len(result["nodes"]) == 3
 
-        # Check node structure
-        python_node = next(n for n in result["nodes"] if n["id"] == "Python")
-        assert python_node["count"] == 3
-        assert python_node["type"] == "theme"
-        assert "group" in python_node
+        # Check node structure: [id, group, count], type via group index
+        python_node = next(n for n in result["nodes"] if n[0] == "Python")
+        label, group, count = python_node
+        assert count == 3
+        assert result["types"][group] == "theme"
 
     def test_prepare_data_groups_by_type(self):
         """Patterns of same type get same group number."""
@@ -315,7 +375,7 @@ class TestTopicClusterViz:
         ]
         result = TopicClusterViz.prepare_data(patterns)
 
-        groups = {n["id"]: n["group"] for n in result["nodes"]}
+        groups = {label: group for label, group, _ in result["nodes"]}
         assert groups["A"] == groups["B"]  # Same type
         assert groups["A"] != groups["C"]  # Different type
 
@@ -328,11 +388,12 @@ class TestTopicClusterViz:
         ]
         result = TopicClusterViz.prepare_data(patterns)
 
-        # Should have one link between A and B
+        # Should have one link between A and B, by node index
         assert len(result["links"]) == 1
-        link = result["links"][0]
-        assert set([link["source"], link["target"]]) == {"A", "B"}
-        assert link["value"] == 1
+        src, tgt, value = result["links"][0]
+        labels = [n[0] for n in result["nodes"]]
+        assert {labels[src], labels[tgt]} == {"A", "B"}
+        assert value == 1
 
     def test_prepare_data_counts_multiple_shared_conversations(self):
         """Link value reflects number of shared conversations."""
@@ -343,7 +404,57 @@ class TestTopicClusterViz:
         result = TopicClusterViz.prepare_data(patterns)
 
         assert len(result["links"]) == 1
-        assert result["links"][0]["value"] == 2  # Two shared conversations
+        assert result["links"][0][2] == 2  # Two shared conversations
+
+    def test_prepare_data_ignores_repeated_conversation_ids(self):
+        """A conversation listed twice in one pattern creates no self-link."""
+        patterns = [
+            {"label": "A", "type": "theme", "conversation_ids": ["c1", "c1"]},
+            {"label": "B", "type": "theme", "conversation_ids": ["c1"]},
+        ]
+        result = TopicClusterViz.prepare_data(patterns)
+
+        assert result["links"] == [[0, 1, 1]]
+
+    def test_prepare_data_caps_labels_per_conversation(self):
+        """Only the most frequent labels of a crowded conversation are paired."""
+        patterns = [
+            {"label": "A", "type": "theme", "conversation_ids": ["c1", "c2", "c3"]},
+            {"label": "B", "type": "theme", "conversation_ids": ["c1", "c2"]},
+            {"label": "C", "type": "theme", "conversation_ids": ["c1"]},
+        ]
+        result = TopicClusterViz.prepare_data(patterns, max_labels_per_conversation=2)
+
+        assert result["links"] == [[0, 1, 2]]
+        assert len(result["nodes"]) == 3
+
+        uncapped = TopicClusterViz.prepare_data(patterns, max_labels_per_conversation=None)
+        assert len(uncapped["links"]) == 3
+
+    def test_prepare_data_filters_and_caps_links(self):
+        """Weak links are dropped and the strongest are kept first."""
+        patterns = [
+            {"label": "A", "type": "theme", "conversation_ids": ["c1", "c2", "c3"]},
+            {"label": "B", "type": "theme", "conversation_ids": ["c1", "c2"]},
+            {"label": "C", "type": "theme", "conversation_ids": ["c3"]},
+        ]
+        result = TopicClusterViz.prepare_data(patterns, min_cooccurrence=2)
+        assert result["links"] == [[0, 1, 2]]
+
+        result = TopicClusterViz.prepare_data(patterns, max_links=1)
+        assert result["links"] == [[0, 1, 2]]
+
+    def test_prepare_data_repeated_label_links_last_node(self):
+        """A label shared by two patterns links to its last node."""
+        patterns = [
+            {"label": "A", "type": "theme", "conversation_ids": ["c1"]},
+            {"label": "B", "type": "theme", "conversation_ids": ["c1"]},
+            {"label": "A", "type": "skill", "conversation_ids": ["c2"]},
+        ]
+        result = TopicClusterViz.prepare_data(patterns)
+
+        assert result["types"] == ["theme", "skill"]
+        assert result["links"] == [[2, 1, 1]]
 
     def test_prepare_data_skips_empty_labels(self):
         """Patterns without labels are skipped."""
@@ -376,6 +487,25 @@ class TestTopicClusterViz:
         assert "dragged" in code
         assert "dragended" in code
 
+    def test_get_js_code_has_canvas_fallback(self):
+        """Large graphs render to canvas with quadtree hit-testing."""
+        code = TopicClusterViz.get_js_code()
+        assert "CANVAS_NODE_THRESHOLD" in code
+        assert "getContext('2d')" in code
+        assert "simulation.find" in code
+
+    def test_get_js_code_scales_canvas_for_hidpi(self):
+        """The canvas backing store is sized by devicePixelRatio."""
+        code = TopicClusterViz.get_js_code()
+        assert "window.devicePixelRatio" in code
+        assert "ctx.scale(dpr, dpr)" in code
+
+    def test_get_js_code_resets_shared_tooltip_width(self):
+        """The width cap on the shared tooltip is cleared when it hides."""
+        code = TopicClusterViz.get_js_code()
+        assert "style('max-width', '200px')" in code
+        assert "style('max-width', null)" in code
+
     def test_get_js_code_references_data(self):
         """JS code references DATA.nodes and DATA.links."""
         code = TopicClusterViz.get_js_code()
@@ -514,6 +644,16 @@ class TestLengthDistributionViz:
         assert result["stats"]["min"] == 1
         assert result["stats"]["max"] == 1
 
+    def test_prepare_data_empty_conversation_in_first_bin(self):
+        """Conversations with no messages are counted in the first bin."""
+        conversations = [{"mapping": {}}, {"messages": []}, {"messages": [1, 2, 3]}]
+        result = LengthDistributionViz.prepare_data(conversations, bin_size=5)
+
+        assert result["distribution"] == [
+            {"bin": "1-5", "min": 1, "max": 5, "count": 3},
+        ]
+        assert result["stats"]["min"] == 1
+
     def test_get_js_code_returns_string(self):
         """JS code is returned as string."""
         code = LengthDistributionViz.get_js_code()
@@ -565,3 +705,58 @@ class TestLengthDistributionIntegration:
         assert "Conversation Length Distribution" in content
         assert '"distribution"' in content
         assert '"stats"' in content
+
+
+class TestConversationColumns:
+    """Tests for columns shared across visualizations."""
+
+    def test_from_conversations_parses_both_formats(self):
+        """Epoch and ISO timestamps are parsed; missing ones are skipped."""
+        columns = ConversationColumns.from_conversations([
+            {"create_time": datetime(2024, 1, 8, 9, 0).timestamp()},
+            {"created_at": "2024-01-09T14:00:00"},
+            {"other_field": "value"},
+        ])
+        assert columns.created == [datetime(2024, 1, 8, 9, 0), datetime(2024, 1, 9, 14, 0)]
+
+    def test_vizs_accept_columns(self):
+        """Time-based vizs give the same result from columns as from raw dicts."""
+        conversations = [
+            {"create_time": datetime(2024, 1, 8, 9, 30).timestamp()},
+            {"create_time": datetime(2024, 1, 8, 22, 0).timestamp()},
+            {"created_at": "2024-01-10T08:00:00Z"},
+        ]
+        columns = ConversationColumns.from_conversations(conversations)
+        assert HeatmapViz.prepare_data(columns) == HeatmapViz.prepare_data(conversations)
+        assert TimelineViz.prepare_data(columns) == TimelineViz.prepare_data(conversations)
+
+    def test_length_distribution_accepts_columns(self):
+        """Message counts are extracted once and reused by the histogram."""
+        conversations = [
+            {"mapping": {str(i): {} for i in range(3)}},
+            {"messages": [{}] * 8},
+            {"mapping": {}},
+        ]
+        columns = ConversationColumns.from_conversations(conversations)
+        assert columns.lengths == [3, 8, 1]
+        assert (
+            LengthDistributionViz.prepare_data(columns)
+            == LengthDistributionViz.prepare_data(conversations)
+        )
+
+
+class TestMinifyJs:
+    """Tests for import-time JS minification."""
+
+    def test_strips_indentation_and_comments(self):
+        """Indentation, blank lines and comment lines are removed."""
+        from chat_retro.viz_templates.minify import minify_js
+
+        source = "(function() {\n    // Scales\n\n    const x = 1;\n})();\n"
+        assert minify_js(source) == "(function() {\nconst x = 1;\n})();"
+
+    def test_templates_are_minified(self):
+        """Embedded templates carry no comment lines or indentation."""
+        for viz in (TimelineViz, HeatmapViz, TopicClusterViz, LengthDistributionViz):
+            for line in viz.get_js_code().splitlines():
+                assert not line.startswith((" ", "//"))